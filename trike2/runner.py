@@ -1,7 +1,8 @@
+from src.board import Board
 from src.game import Game
 from trike_ai.agents import RandomAI, MinimaxAI, MCTSAI
 
-def run_ai_match(agent1, agent2, board_size=7, verbose=True):
+def run_ai_match(agent1, agent2, board_size=7, verbose=True, board_class=Board):
     """
     Run a match between two AI agents.
     
@@ -10,19 +11,20 @@ def run_ai_match(agent1, agent2, board_size=7, verbose=True):
         agent2: Second AI agent
         board_size: Size of the game board
         verbose: Whether to print game progress
+        board_class: Board engine to play on (Board or BitBoard)
     
     Returns:
         tuple: (winner, scores) where winner is the name of the winning agent or "Draw"
                and scores is (agent1_score, agent2_score)
     """
-    game = Game(board_size)
+    game = Game(board_size, board_class)
     
     if verbose:
         print(f"Starting match: {agent1.name} vs {agent2.name}")
     
     # Continue until the game is over
-    while not (game.pawn.position is not None and game.board.is_pawn_trapped()):
-        current_player_index = game.current_player_index
+    while not game.is_terminal():
+        current_player_index = game.to_move()
         current_agent = agent1 if current_player_index == 0 else agent2
         
         # Get the agent's move
@@ -37,57 +39,26 @@ def run_ai_match(agent1, agent2, board_size=7, verbose=True):
             print(f"{current_agent.name} chooses move: {move}")
             
         # Apply the move
-        q, r = move
-        current_player = game.players[current_player_index]
-        
-        # If this is first move, place pawn
-        if game.pawn.position is None:
-            game.board.place_checker(q, r, current_player)
-            game.pawn.position = (q, r)
-            game.board.pawn_position = (q, r)
-        else:
-            # Regular move - place checker and move pawn
-            game.board.place_checker(q, r, current_player)
-            game.pawn.position = (q, r)
-            game.board.pawn_position = (q, r)
+        game.play(move)
         
         # Pie rule implementation
-        if game.first_move_done and game.pie_rule_available:
-            if current_player_index == 1:
-                # Simple heuristic for pie rule: use it if the first move was
-                # too advantageous (e.g., central position)
-                size = board_size
-                center_q, center_r = size // 2, size // 2
-                
-                # If first move was close to center, agent2 might choose to swap
-                if abs(q - center_q) + abs(r - center_r) <= 1:
-                    if verbose:
-                        print(f"{agent2.name} uses pie rule to swap colors")
-                    game.players.reverse()
-                    game.current_player_index = 1
+        if game.can_swap():
+            # Simple heuristic for pie rule: use it if the first move was
+            # too advantageous (e.g., central position)
+            q, r = move
+            size = board_size
+            center_q, center_r = size // 2, size // 2
             
-            game.pie_rule_available = False
-        else:
-            # Normal turn, advance to next player
-            game.current_player_index = (current_player_index + 1) % 2
+            # If first move was close to center, agent2 might choose to swap
+            if abs(q - center_q) + abs(r - center_r) <= 1:
+                if verbose:
+                    print(f"{agent2.name} uses pie rule to swap colors")
+                game.swap()
     
     # Calculate final scores
-    pawn_pos = game.pawn.position
-    neighbors = game.board.get_neighbors(*pawn_pos)
-    under = game.board.grid[pawn_pos]
-    
-    adj = [game.board.grid.get(n) for n in neighbors]
-    
-    black_score = sum(1 for c in adj + [under] if c and c.color == "black")
-    white_score = sum(1 for c in adj + [under] if c and c.color == "white")
+    player1_score, player2_score = game.scores()
     
     # Determine winner
-    player1 = game.players[0]
-    player2 = game.players[1]
-    
-    player1_score = black_score if player1.color == "black" else white_score
-    player2_score = white_score if player1.color == "black" else black_score
-    
     if player1_score > player2_score:
         winner = agent1.name
     elif player2_score > player1_score:
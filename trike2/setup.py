@@ -20,4 +20,8 @@ setup(
     install_requires=[
         # Add any dependencies here
     ],
+    extras_require={
+        # Batch simulation and vectorised MCTS selection
+        'numpy': ['numpy'],
+    },
 )
\ No newline at end of file
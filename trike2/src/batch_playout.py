@@ -0,0 +1,192 @@
+import argparse
+import time
+
+import numpy as np
+
+from .checker import BLACK, COLOR_CODES, EMPTY, WHITE
+from .layout import get_layout
+
+# Colour code of the sentinel cell that pads rays and neighbour lists
+_OFF_BOARD = 3
+
+
+class BatchSimulator:
+    """
+    Random Trike games played in lockstep as NumPy arrays.
+
+    K games are held as a (K, cells + 1) array of colour codes, where the
+    last column is an always-occupied sentinel used to pad rays and
+    neighbour lists to a fixed width. Every step() computes the legal-move
+    masks of all running games with array operations and plays one
+    uniformly random legal move in each of them. The simulated games never
+    use the pie rule, so statistics such as first_move_stats() describe the
+    first mover's chances without a swap.
+    """
+
+    def __init__(self, size, seed=None):
+        self.size = size
+        self.layout = get_layout(size)
+        self.rng = np.random.default_rng(seed)
+        cells = self.layout.num_cells
+        # (cells, 6, size - 1) ray table padded with the sentinel index
+        length = max(size - 1, 1)
+        self.rays = np.full((cells, 6, length), cells, dtype=np.intp)
+        for i, rays in enumerate(self.layout.rays):
+            for d, ray in enumerate(rays):
+                self.rays[i, d, :len(ray)] = ray
+        # (cells, 7) scoring cells: the neighbours plus the cell itself
+        self.score_cells = np.full((cells, 7), cells, dtype=np.intp)
+        for i, neighbors in enumerate(self.layout.neighbors):
+            self.score_cells[i, :len(neighbors) + 1] = neighbors + (i,)
+        self.reset(0)
+
+    def reset(self, count):
+        """Start `count` games from the empty board, white to move as in Game."""
+        cells = self.layout.num_cells
+        self.cells = np.zeros((count, cells + 1), dtype=np.int8)
+        self.cells[:, cells] = _OFF_BOARD
+        self.pawn = np.full(count, -1, dtype=np.intp)
+        self.color = np.full(count, WHITE, dtype=np.int8)
+        # Whether player 0 holds black, for mapping scores to player indices
+        self.player0_black = np.zeros(count, dtype=bool)
+        self.active = np.ones(count, dtype=bool)
+        self.plies = np.zeros(count, dtype=np.intp)
+        self.first_move = np.full(count, -1, dtype=np.intp)
+
+    def load(self, games):
+        """Start one simulated game from the position of each Game in `games`."""
+        self.reset(len(games))
+        for k, game in enumerate(games):
+            board = game.board
+            self.cells[k, :-1] = np.frombuffer(board.cells, dtype=np.int8)
+            self.pawn[k] = -1 if board.pawn_index is None else board.pawn_index
+            self.color[k] = COLOR_CODES[game.players[game.current_player_index].color]
+            self.player0_black[k] = game.players[0].color == "black"
+            self.plies[k] = game.ply()
+
+    def legal_masks(self, games=None):
+        """
+        Return a (len(games), cells) boolean mask of the legal moves.
+
+        Before the first move every empty cell is legal; afterwards each ray
+        out of the pawn is legal up to its first occupied cell.
+        """
+        if games is None:
+            games = np.arange(len(self.pawn))
+        cells = self.cells[games]
+        mask = np.zeros(cells.shape, dtype=bool)
+        pawn = self.pawn[games]
+
+        opening = pawn < 0
+        mask[opening] = cells[opening] == EMPTY
+
+        moving = np.flatnonzero(~opening)
+        if moving.size:
+            rays = self.rays[pawn[moving]]
+            free = np.logical_and.accumulate(
+                cells[moving[:, None, None], rays] == EMPTY, axis=2)
+            game, direction, step = np.nonzero(free)
+            mask[moving[game], rays[game, direction, step]] = True
+        return mask[:, :-1]
+
+    def step(self):
+        """
+        Play one random legal move in every running game.
+
+        Games whose pawn is trapped are marked finished instead.
+
+        Returns:
+            int: Number of games still running
+        """
+        games = np.flatnonzero(self.active)
+        if not games.size:
+            return 0
+        mask = self.legal_masks(games)
+        # The highest random key among the legal cells is a uniform choice
+        keys = np.where(mask, self.rng.random(mask.shape), -1.0)
+        moves = keys.argmax(axis=1)
+        stuck = ~mask[np.arange(len(games)), moves]
+        self.active[games[stuck]] = False
+
+        games, moves = games[~stuck], moves[~stuck]
+        self.cells[games, moves] = self.color[games]
+        self.pawn[games] = moves
+        self.color[games] = BLACK + WHITE - self.color[games]
+        opening = self.first_move[games] < 0
+        self.first_move[games[opening]] = moves[opening]
+        self.plies[games] += 1
+        return games.size
+
+    def scores(self):
+        """Return a (K, 2) array of scores by player index at the current pawns."""
+        count = len(self.pawn)
+        values = self.cells[np.arange(count)[:, None], self.score_cells[self.pawn]]
+        black = (values == BLACK).sum(axis=1)
+        white = (values == WHITE).sum(axis=1)
+        placed = self.pawn >= 0
+        black, white = np.where(placed, black, 0), np.where(placed, white, 0)
+        return np.stack([np.where(self.player0_black, black, white),
+                         np.where(self.player0_black, white, black)], axis=1)
+
+    def run(self):
+        """Step every game to the end and return scores() of the final positions."""
+        while self.step():
+            pass
+        return self.scores()
+
+    def simulate(self, count):
+        """Play `count` random games from the empty board and return their scores."""
+        self.reset(count)
+        return self.run()
+
+
+def first_move_stats(size, games, seed=None):
+    """
+    Simulate random games and summarise the first mover's results.
+
+    Returns:
+        dict: "wins", "draws" and "losses" rates of player 0, the average
+              game length under "plies", and per first-move cell a
+              (games, win rate) pair under "first_moves"
+    """
+    simulator = BatchSimulator(size, seed)
+    scores = simulator.simulate(games)
+    margin = scores[:, 0] - scores[:, 1]
+    stats = {
+        "wins": float(np.mean(margin > 0)),
+        "draws": float(np.mean(margin == 0)),
+        "losses": float(np.mean(margin < 0)),
+        "plies": float(simulator.plies.mean()),
+        "first_moves": {},
+    }
+    wins = np.where(margin > 0, 1.0, np.where(margin == 0, 0.5, 0.0))
+    for cell in np.unique(simulator.first_move):
+        played = simulator.first_move == cell
+        stats["first_moves"][simulator.layout.coords[cell]] = (int(played.sum()),
+                                                               float(wins[played].mean()))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate random Trike games in batches")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[7, 13, 19], help="Board sizes")
+    parser.add_argument("--games", type=int, default=10000, help="Games per board size")
+    parser.add_argument("--top", type=int, default=5, help="Best first moves to list")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        start = time.perf_counter()
+        stats = first_move_stats(size, args.games, args.seed)
+        elapsed = time.perf_counter() - start
+        print(f"size {size}: {args.games} games in {elapsed:.2f}s ({args.games / elapsed:.0f} games/s), "
+              f"{stats['plies']:.1f} plies on average")
+        print(f"  first mover wins {stats['wins']:.1%}, draws {stats['draws']:.1%}, "
+              f"loses {stats['losses']:.1%}")
+        best = sorted(stats["first_moves"].items(), key=lambda item: item[1][1], reverse=True)
+        for cell, (played, rate) in best[:args.top]:
+            print(f"  first move {cell}: {rate:.1%} over {played} games")
+
+
+if __name__ == "__main__":
+    main()
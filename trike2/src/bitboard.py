@@ -0,0 +1,170 @@
+from array import array
+
+from .board import BoardBase, GridView
+from .checker import BLACK, EMPTY, WHITE, color_code
+from .layout import HEX_DIRECTIONS, get_layout
+
+
+class BitBoard(BoardBase):
+    """
+    Board engine that stores occupancy and colours as Python-int bitmasks.
+
+    Bit i corresponds to cell layout.coords[i]. The public interface mirrors
+    Board, so it can be passed to Game as a drop-in replacement.
+    """
+
+    HEX_DIRECTIONS = HEX_DIRECTIONS
+
+    def __init__(self, size):
+        self.size = size
+        self.layout = get_layout(size)
+        self.occupied = 0
+        self.black = 0
+        self.white = 0
+        # Colour code of every cell by layout index, as Board stores it,
+        # kept alongside the bitmasks so playouts can load it directly
+        self.cells = array('b', bytes(self.layout.num_cells))
+        self.pawn_index = None
+        # Zobrist hash of checkers and pawn, kept up to date incrementally
+        self.zobrist = 0
+        self.grid = GridView(self)
+
+    def color_at(self, i):
+        if self.black >> i & 1:
+            return BLACK
+        if self.white >> i & 1:
+            return WHITE
+        return EMPTY
+
+    def is_valid_position(self, q, r):
+        return (q, r) in self.layout.index
+
+    def place_checker(self, q, r, checker):
+        i = self.layout.index.get((q, r))
+        if i is None:
+            return False
+        bit = 1 << i
+        if self.occupied & bit:
+            return False
+        self.occupied |= bit
+        code = color_code(checker)
+        self.cells[i] = code
+        if code == BLACK:
+            self.black |= bit
+            self.zobrist ^= self.layout.zobrist_black[i]
+        else:
+            self.white |= bit
+            self.zobrist ^= self.layout.zobrist_white[i]
+        return True
+
+    def remove_checker(self, q, r):
+        i = self.layout.index.get((q, r))
+        if i is None or not self.occupied >> i & 1:
+            return False
+        if self.black >> i & 1:
+            self.zobrist ^= self.layout.zobrist_black[i]
+        else:
+            self.zobrist ^= self.layout.zobrist_white[i]
+        self.cells[i] = EMPTY
+        clear = ~(1 << i)
+        self.occupied &= clear
+        self.black &= clear
+        self.white &= clear
+        return True
+
+    def is_valid_move(self, q_from, r_from, q_to, r_to):
+        index = self.layout.index
+        target = index.get((q_to, r_to))
+        if target is None or self.occupied >> target & 1:
+            return False
+        dq = q_to - q_from
+        dr = r_to - r_from
+        # Straight hex lines keep q, r or q + r constant
+        if not (dq == 0 or dr == 0 or dq == -dr) or (dq, dr) == (0, 0):
+            return False
+        dist = max(abs(dq), abs(dr))
+        step_q, step_r = dq // dist, dr // dist
+        for step in range(1, dist):
+            mid = index.get((q_from + step_q * step, r_from + step_r * step))
+            if mid is not None and self.occupied >> mid & 1:
+                return False
+        return True
+
+    def legal_moves(self, q, r):
+        """Return every cell the pawn on (q, r) can move to, walking the ray tables."""
+        coords = self.layout.coords
+        occupied = self.occupied
+        moves = []
+        for ray in self.layout.rays[self.layout.index[(q, r)]]:
+            for i in ray:
+                if occupied >> i & 1:
+                    break
+                moves.append(coords[i])
+        return moves
+
+    def move_pawn(self, q_from, r_from, q_to, r_to):
+        if self.is_valid_move(q_from, r_from, q_to, r_to):
+            self.pawn_position = (q_to, r_to)
+            return True
+        return False
+
+    def get_adjacent_checkers(self, q, r):
+        return [self.grid[pos] for pos in self.get_neighbors(q, r)
+                if self.grid[pos] is not None]
+
+    def is_pawn_trapped(self):
+        if self.pawn_index is None:
+            return False
+        return not self.layout.neighbor_masks[self.pawn_index] & ~self.occupied
+
+    def pawn_liberties(self):
+        """Number of empty cells next to the pawn, or None before it is placed."""
+        if self.pawn_index is None:
+            return None
+        return bin(self.layout.neighbor_masks[self.pawn_index] & ~self.occupied).count("1")
+
+    def neighbor_counts(self, q, r):
+        """Return (black, white) counts of the checkers adjacent to (q, r)."""
+        mask = self.layout.neighbor_masks[self.layout.index[(q, r)]]
+        return bin(mask & self.black).count("1"), bin(mask & self.white).count("1")
+
+    def pawn_scores(self):
+        """Return (black, white) checkers adjacent to or underneath the pawn."""
+        if self.pawn_index is None:
+            return 0, 0
+        mask = self.layout.neighbor_masks[self.pawn_index] | 1 << self.pawn_index
+        return bin(mask & self.black).count("1"), bin(mask & self.white).count("1")
+
+    def _occupied_cells(self):
+        occupied = self.occupied
+        while occupied:
+            low = occupied & -occupied
+            i = low.bit_length() - 1
+            yield i, BLACK if self.black & low else WHITE
+            occupied ^= low
+
+    def get_neighbors(self, q, r):
+        coords = self.layout.coords
+        return [coords[i] for i in self.layout.neighbors[self.layout.index[(q, r)]]]
+
+    def copy(self):
+        """Return an independent copy of the board."""
+        board = BitBoard.__new__(BitBoard)
+        board.size = self.size
+        board.layout = self.layout
+        board.occupied = self.occupied
+        board.black = self.black
+        board.white = self.white
+        board.cells = array('b', self.cells)
+        board.pawn_index = self.pawn_index
+        board.zobrist = self.zobrist
+        board.grid = GridView(board)
+        return board
+
+    def reset(self):
+        self.occupied = 0
+        self.black = 0
+        self.white = 0
+        self.cells = array('b', bytes(self.layout.num_cells))
+        self.pawn_index = None
+        self.zobrist = 0
@@ -1,4 +1,73 @@
-class Board:
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Mapping
+
+from .checker import BLACK, CHECKERS, EMPTY, WHITE, color_code
+from .layout import get_layout
+
+
+class GridView(Mapping):
+    """
+    Read-only dict-like view of a board's cells.
+
+    Maps every (q, r) cell to a shared Checker of the stored colour, or None
+    when empty, so code written against a dict grid (iteration, grid[(q, r)],
+    grid.get(...) and checker.color) keeps working on compact boards.
+    """
+
+    def __init__(self, board):
+        self._board = board
+
+    def __getitem__(self, pos):
+        return CHECKERS[self._board.color_at(self._board.layout.index[pos])]
+
+    def __iter__(self):
+        return iter(self._board.layout.coords)
+
+    def __len__(self):
+        return self._board.layout.num_cells
+
+    def __contains__(self, pos):
+        return pos in self._board.layout.index
+
+
+class BoardBase(ABC):
+    """
+    Pawn and position-key handling shared by the board engines.
+
+    Subclasses set size, layout, zobrist and pawn_index and yield their
+    checkers as (cell index, colour code) pairs from _occupied_cells().
+    """
+
+    @property
+    def pawn_position(self):
+        if self.pawn_index is None:
+            return None
+        return self.layout.coords[self.pawn_index]
+
+    @pawn_position.setter
+    def pawn_position(self, pos):
+        if self.pawn_index is not None:
+            self.zobrist ^= self.layout.zobrist_pawn[self.pawn_index]
+        self.pawn_index = None if pos is None else self.layout.index[pos]
+        if self.pawn_index is not None:
+            self.zobrist ^= self.layout.zobrist_pawn[self.pawn_index]
+
+    def symmetric_keys(self):
+        """Zobrist keys of the position under each of the six board symmetries."""
+        return self.layout.symmetric_keys(self._occupied_cells(), self.pawn_index)
+
+    def canonical_key(self):
+        """Return (key, symmetry) for the canonical orientation of the position."""
+        return self.layout.canonical_key(self._occupied_cells(), self.pawn_index)
+
+    @abstractmethod
+    def _occupied_cells(self):
+        """Yield (cell index, colour code) for every checker on the board."""
+        pass
+
+
+class Board(BoardBase):
     HEX_DIRECTIONS = [
         (1, 0), (1, -1), (0, -1),
         (-1, 0), (-1, 1), (0, 1)
@@ -6,25 +75,67 @@ class Board:
 
     def __init__(self, size):
         self.size = size
-        self.grid = self.create_grid()
-        self.pawn_position = None
+        self.layout = get_layout(size)
+        # Colour code (EMPTY, BLACK or WHITE) of every cell, by layout index
+        self.cells = array('b', bytes(self.layout.num_cells))
+        self.grid = GridView(self)
+        # Number of empty on-board neighbours of every cell, so trap checks
+        # are a single lookup
+        self.empty_neighbors = self.count_empty_neighbors()
+        # Number of black and white checkers next to every cell, so scoring
+        # the pawn is a lookup instead of a scan
+        self.black_neighbors = array('b', bytes(self.layout.num_cells))
+        self.white_neighbors = array('b', bytes(self.layout.num_cells))
+        # Zobrist hash of checkers and pawn, kept up to date incrementally
+        self.zobrist = 0
+        self.pawn_index = None
+
+    def color_at(self, i):
+        return self.cells[i]
 
-    def create_grid(self):
-        # Only valid hexes within a triangle of given side length
-        grid = {}
-        for q in range(self.size):
-            for r in range(self.size - q):
-                grid[(q, r)] = None
-        return grid
+    def count_empty_neighbors(self):
+        return array('b', [
+            sum(1 for n in self.layout.neighbors[i] if self.cells[n] == EMPTY)
+            for i in range(self.layout.num_cells)
+        ])
 
     def is_valid_position(self, q, r):
-        return (q, r) in self.grid
+        return (q, r) in self.layout.index
 
     def place_checker(self, q, r, checker):
-        if self.is_valid_position(q, r) and self.grid[(q, r)] is None:
-            self.grid[(q, r)] = checker
-            return True
-        return False
+        i = self.layout.index.get((q, r))
+        if i is None or self.cells[i] != EMPTY:
+            return False
+        code = color_code(checker)
+        self.cells[i] = code
+        if code == BLACK:
+            self.zobrist ^= self.layout.zobrist_black[i]
+            counts = self.black_neighbors
+        else:
+            self.zobrist ^= self.layout.zobrist_white[i]
+            counts = self.white_neighbors
+        empty = self.empty_neighbors
+        for n in self.layout.neighbors[i]:
+            empty[n] -= 1
+            counts[n] += 1
+        return True
+
+    def remove_checker(self, q, r):
+        i = self.layout.index.get((q, r))
+        if i is None or self.cells[i] == EMPTY:
+            return False
+        if self.cells[i] == BLACK:
+            self.zobrist ^= self.layout.zobrist_black[i]
+            counts = self.black_neighbors
+        else:
+            self.zobrist ^= self.layout.zobrist_white[i]
+            counts = self.white_neighbors
+        self.cells[i] = EMPTY
+        empty = self.empty_neighbors
+        for n in self.layout.neighbors[i]:
+            empty[n] += 1
+            counts[n] -= 1
+        return True
 
     def is_valid_move(self, q_from, r_from, q_to, r_to):
         if not self.is_valid_position(q_to, r_to):
@@ -45,6 +156,23 @@ class Board:
                     return True
         return False
 
+    def legal_moves(self, q, r):
+        """
+        Return every cell the pawn on (q, r) can move to.
+
+        Walks the precomputed rays out from the pawn and stops each one at the
+        first occupied cell, instead of testing every cell with is_valid_move.
+        """
+        cells = self.cells
+        coords = self.layout.coords
+        moves = []
+        for ray in self.layout.rays[self.layout.index[(q, r)]]:
+            for i in ray:
+                if cells[i]:
+                    break
+                moves.append(coords[i])
+        return moves
+
     def move_pawn(self, q_from, r_from, q_to, r_to):
         if self.is_valid_move(q_from, r_from, q_to, r_to):
             self.pawn_position = (q_to, r_to)
@@ -60,15 +188,38 @@ class Board:
         return adjacent
 
     def is_pawn_trapped(self):
-        if self.pawn_position is None:
+        if self.pawn_index is None:
             return False
-        q, r = self.pawn_position
-        for dq, dr in self.HEX_DIRECTIONS:
-            pos = (q + dq, r + dr)
-            if self.is_valid_position(*pos) and self.grid[pos] is None:
-                return False
-        return True
-    
+        return self.empty_neighbors[self.pawn_index] == 0
+
+    def pawn_liberties(self):
+        """Number of empty cells next to the pawn, or None before it is placed."""
+        if self.pawn_index is None:
+            return None
+        return self.empty_neighbors[self.pawn_index]
+
+    def neighbor_counts(self, q, r):
+        """Return (black, white) counts of the checkers adjacent to (q, r)."""
+        i = self.layout.index[(q, r)]
+        return self.black_neighbors[i], self.white_neighbors[i]
+
+    def pawn_scores(self):
+        """
+        Return (black, white) scores for the current pawn position.
+
+        Each colour scores one point per checker adjacent to or underneath
+        the pawn.
+        """
+        i = self.pawn_index
+        if i is None:
+            return 0, 0
+        under = self.cells[i]
+        return (self.black_neighbors[i] + (under == BLACK),
+                self.white_neighbors[i] + (under == WHITE))
+
+    def _occupied_cells(self):
+        return ((i, code) for i, code in enumerate(self.cells) if code)
+
     def get_neighbors(self, q, r):
         # Hex grid directions (pointy-topped)
         directions = [
@@ -82,10 +233,26 @@ class Board:
                 neighbors.append(neighbor)
         return neighbors
 
+    def copy(self):
+        """Return an independent copy, much cheaper than copy.deepcopy."""
+        board = Board.__new__(Board)
+        board.size = self.size
+        board.layout = self.layout
+        board.cells = self.cells[:]
+        board.grid = GridView(board)
+        board.empty_neighbors = self.empty_neighbors[:]
+        board.black_neighbors = self.black_neighbors[:]
+        board.white_neighbors = self.white_neighbors[:]
+        board.zobrist = self.zobrist
+        board.pawn_index = self.pawn_index
+        return board
+
     def reset(self):
         # Clear all checkers from the board
-        for pos in self.grid:
-            self.grid[pos] = None
-        # Reset pawn position if you store it here
-        if hasattr(self, 'pawn_position'):
-            self.pawn_position = None
\ No newline at end of file
+        self.cells = array('b', bytes(self.layout.num_cells))
+        self.empty_neighbors = self.count_empty_neighbors()
+        self.black_neighbors = array('b', bytes(self.layout.num_cells))
+        self.white_neighbors = array('b', bytes(self.layout.num_cells))
+        # Reset pawn position and the hash along with it
+        self.pawn_index = None
+        self.zobrist = 0
@@ -1,4 +1,18 @@
+# Compact colour codes stored on the boards
+EMPTY, BLACK, WHITE = 0, 1, 2
+COLOR_CODES = {"black": BLACK, "white": WHITE}
+
+
+def color_code(checker):
+    """Return the colour code of a checker, player or colour code."""
+    if isinstance(checker, int):
+        return checker
+    return COLOR_CODES[checker.color]
+
+
 class Checker:
+    __slots__ = ("color",)
+
     def __init__(self, color):
         if color not in ("black", "white"):
             raise ValueError("Checker color must be 'black' or 'white'.")
@@ -8,4 +22,8 @@ class Checker:
         if board.is_valid_position(position):
             board.place_checker(self, position)
         else:
-            raise ValueError("Invalid position for placing checker.")
\ No newline at end of file
+            raise ValueError("Invalid position for placing checker.")
+
+
+# Shared read-only checkers for each colour code, handed out by board views
+CHECKERS = (None, Checker("black"), Checker("white"))
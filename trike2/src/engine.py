@@ -0,0 +1,141 @@
+import random
+from abc import ABC, abstractmethod
+
+
+class GameEngine(ABC):
+    """
+    Interface that AI agents and the match runner play Trike through.
+
+    Moves are (q, r) cells: the mover places a checker there and the pawn
+    moves onto it. Players are referred to by index (0 or 1), and the board
+    side length is available as `size`. Any backend implementing these
+    methods can be searched by every agent without changes.
+    """
+
+    @abstractmethod
+    def legal_moves(self):
+        """Return the list of (q, r) moves available to the player to move."""
+        pass
+
+    @abstractmethod
+    def play(self, move):
+        """Apply a move in place and pass the turn."""
+        pass
+
+    @abstractmethod
+    def undo(self):
+        """Take back the last move applied with play()."""
+        pass
+
+    @abstractmethod
+    def is_terminal(self):
+        """Return True once the pawn is trapped."""
+        pass
+
+    @abstractmethod
+    def scores(self):
+        """Return (player 0, player 1) scores around the current pawn position."""
+        pass
+
+    def cutoff_scores(self):
+        """
+        Return (player 0, player 1) scores to judge a playout cut off here.
+
+        Defaults to scores(). Engines can leave out checkers that are next
+        to the pawn only because of the last moves, which would otherwise
+        favour one player by the parity of the cutoff.
+        """
+        return self.scores()
+
+    @abstractmethod
+    def clone(self):
+        """Return an independent copy that can be searched without side effects."""
+        pass
+
+    @abstractmethod
+    def key(self):
+        """Return a hash key identifying the current position."""
+        pass
+
+    @abstractmethod
+    def to_move(self):
+        """Return the index of the player to move."""
+        pass
+
+    @abstractmethod
+    def ply(self):
+        """Return the number of moves played so far."""
+        pass
+
+    @abstractmethod
+    def can_swap(self):
+        """Return True if the second player may still invoke the pie rule."""
+        pass
+
+    @abstractmethod
+    def swap(self):
+        """Invoke the pie rule, swapping the players' colours."""
+        pass
+
+    def canonical_key(self):
+        """
+        Return (key, symmetry) identifying the position up to board symmetry.
+
+        Engines without symmetry support fall back to key() and the identity.
+        """
+        return self.key(), 0
+
+    def transform_move(self, move, symmetry, inverse=False):
+        """Map a move into a symmetry's orientation, or back with inverse=True."""
+        return move
+
+    def unique_moves(self, moves):
+        """Drop moves that mirror an earlier one under a symmetry of the position."""
+        return moves
+
+    def random_playout(self, rng=random, moves=None):
+        """
+        Play uniformly random moves to the end of the game and return scores().
+
+        Every move is taken back afterwards, so the position is unchanged.
+        If a list is given as `moves`, the moves played are appended to it.
+        """
+        return self.truncated_playout(rng, moves)[0]
+
+    def truncated_playout(self, rng=random, moves=None, max_plies=None, region_limit=None):
+        """
+        Play uniformly random moves until the game ends or a cutoff is hit.
+
+        The position is restored afterwards. Engines can override this with
+        a faster kernel; this generic version has no notion of regions and
+        ignores `region_limit`.
+
+        Args:
+            rng: Source of randomness
+            moves: Optional list that the moves played are appended to
+            max_plies: Stop after this many moves, if set
+            region_limit: Stop once the empty region around the pawn has at
+                most this many cells, if set
+
+        Returns:
+            tuple: (scores, whether the game ended). A finished playout gives
+                   its final scores(), a cut-off one cutoff_scores().
+        """
+        moves_played = 0
+        finished = True
+        while not self.is_terminal():
+            legal = self.legal_moves()
+            if not legal:
+                break
+            if max_plies is not None and moves_played >= max_plies:
+                finished = False
+                break
+            move = rng.choice(legal)
+            self.play(move)
+            if moves is not None:
+                moves.append(move)
+            moves_played += 1
+        result = self.scores() if finished else self.cutoff_scores()
+        for _ in range(moves_played):
+            self.undo()
+        return result, finished
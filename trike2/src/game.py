@@ -1,12 +1,18 @@
+import random
+
 from .board import Board
+from .engine import GameEngine
 from .player import Player
 from .pawn import Pawn
-from .checker import Checker
+from .checker import BLACK, COLOR_CODES, Checker
+from .playout import get_kernel
 from .utils import calculate_score
 
-class Game:
-    def __init__(self, board_size):
-        self.board = Board(board_size)
+class Game(GameEngine):
+    def __init__(self, board_size, board_class=Board):
+        # board_class lets faster engines such as BitBoard replace Board
+        self.size = board_size
+        self.board = board_class(board_size)
         self.players = [Player("white"), Player("black")]
         self.current_player_index = 0
         self.pawn = Pawn()
@@ -14,6 +20,8 @@ class Game:
         self.pie_rule_used = False
         self.pie_rule_available = True
         self.first_move_done = False
+        # Saved state for every move applied through play(), popped by undo()
+        self.move_stack = []
 
     def start_game(self):
         self.setup_pawn()
@@ -59,6 +67,159 @@ class Game:
         else:
             self.current_player_index = (self.current_player_index + 1) % 2
 
+    def play(self, move):
+        """
+        Apply a move in place for the player to move.
+
+        Places the mover's checker on the (q, r) cell, puts the pawn on it and
+        passes the turn. The pie rule stays on offer only until the second move.
+        The previous pawn position, player index and pie-rule flags are pushed
+        onto the move stack so that undo() can restore them exactly.
+        """
+        q, r = move
+        current_player = self.players[self.current_player_index]
+        if not self.board.place_checker(q, r, COLOR_CODES[current_player.color]):
+            raise ValueError(f"Cannot place a checker on {move}")
+        self.move_stack.append((move, self.pawn.position, self.current_player_index,
+                                self.first_move_done, self.pie_rule_available))
+        if self.first_move_done:
+            self.pie_rule_available = False
+        self.first_move_done = True
+        self.pawn.position = (q, r)
+        self.board.pawn_position = (q, r)
+        self.current_player_index = (self.current_player_index + 1) % 2
+
+    def undo(self):
+        """Take back the last move applied with play()."""
+        move, pawn_position, player_index, first_move_done, pie_rule_available = self.move_stack.pop()
+        self.board.remove_checker(*move)
+        self.pawn.position = pawn_position
+        self.board.pawn_position = pawn_position
+        self.current_player_index = player_index
+        self.first_move_done = first_move_done
+        self.pie_rule_available = pie_rule_available
+
+    def position_key(self):
+        """
+        Return a 64-bit Zobrist key for the current position.
+
+        The board keeps the checker and pawn part of the hash up to date as
+        moves are played and undone; the colour to move is folded in here.
+        """
+        key = self.board.zobrist
+        if self.players[self.current_player_index].color == "black":
+            key ^= self.board.layout.zobrist_side
+        return key
+
+    def legal_moves(self):
+        if self.pawn.position is None:
+            # Any empty cell is a legal first move
+            return [pos for pos, checker in self.board.grid.items() if checker is None]
+        return self.board.legal_moves(*self.pawn.position)
+
+    def is_terminal(self):
+        return self.pawn.position is not None and self.board.is_pawn_trapped()
+
+    def scores(self):
+        black_score, white_score = self.board.pawn_scores()
+        if self.players[0].color == "black":
+            return black_score, white_score
+        return white_score, black_score
+
+    def cutoff_scores(self):
+        # The checker under the pawn is always the last mover's, and the
+        # cell the pawn left holds the other player's; neither says anything
+        # about control, so count only the remaining neighbours
+        board = self.board
+        if board.pawn_index is None:
+            return 0, 0
+        black, white = board.neighbor_counts(*board.pawn_position)
+        previous = self.move_stack[-1][1] if self.move_stack else None
+        if previous is not None:
+            i = board.layout.index[previous]
+            if i in board.layout.neighbors[board.pawn_index]:
+                if board.color_at(i) == BLACK:
+                    black -= 1
+                else:
+                    white -= 1
+        if self.players[0].color == "black":
+            return black, white
+        return white, black
+
+    def truncated_playout(self, rng=random, moves=None, max_plies=None, region_limit=None):
+        # Runs on the thread's flat scratch buffer instead of play/undo
+        kernel = get_kernel(self.size)
+        result = kernel.run(self, rng, max_plies, region_limit)
+        if moves is not None:
+            coords = kernel.layout.coords
+            moves.extend(coords[i] for i in kernel.played)
+        return result, kernel.finished
+
+    def clone(self):
+        game = Game.__new__(Game)
+        game.size = self.size
+        game.board = self.board.copy()
+        # Players are never mutated during play, so they can be shared
+        game.players = list(self.players)
+        game.current_player_index = self.current_player_index
+        game.pawn = Pawn(self.pawn.position)
+        game.game_over = self.game_over
+        game.pie_rule_used = self.pie_rule_used
+        game.pie_rule_available = self.pie_rule_available
+        game.first_move_done = self.first_move_done
+        game.move_stack = list(self.move_stack)
+        return game
+
+    def key(self):
+        return self.position_key()
+
+    def to_move(self):
+        return self.current_player_index
+
+    def ply(self):
+        return len(self.move_stack)
+
+    def can_swap(self):
+        return self.first_move_done and self.pie_rule_available and self.ply() == 1
+
+    def swap(self):
+        # The pie rule is a one-off decision and is not recorded on the move stack
+        self.players.reverse()
+        self.pie_rule_used = True
+        self.pie_rule_available = False
+
+    def canonical_key(self):
+        key, symmetry = self.board.canonical_key()
+        if self.players[self.current_player_index].color == "black":
+            key ^= self.board.layout.zobrist_side
+        return key, symmetry
+
+    def transform_move(self, move, symmetry, inverse=False):
+        return self.board.layout.transform(move, symmetry, inverse)
+
+    def unique_moves(self, moves):
+        """
+        Keep one move of each group that mirror one another.
+
+        A symmetry of the board that leaves the current position unchanged
+        maps each move to one reaching the mirror image of its position, so
+        the two have the same value and only one needs to be searched. The
+        agents apply this to the moves at the root of their search.
+        """
+        # Symmetries under which the position maps onto itself
+        keys = self.board.symmetric_keys()
+        stabilizer = [t for t in range(1, len(keys)) if keys[t] == keys[0]]
+        if not stabilizer:
+            return moves
+        unique = []
+        mirrored = set()
+        for move in moves:
+            if move in mirrored:
+                continue
+            unique.append(move)
+            mirrored.update(self.transform_move(move, t) for t in stabilizer)
+        return unique
+
     def end_game(self):
         self.game_over = True
         self.calculate_scores()
@@ -77,6 +238,7 @@ class Game:
         self.pie_rule_used = False
         self.pie_rule_available = True
         self.first_move_done = False
+        self.move_stack = []
 
 if __name__ == "__main__":
     size = int(input("Enter board size (7-19): "))
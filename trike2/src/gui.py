@@ -186,12 +186,7 @@ class TrikeGUI:
     
     def show_score(self):
         print("Calculating final score...")
-        pawn_pos = self.game.pawn.position
-        neighbors = self.game.board.get_neighbors(*pawn_pos)
-        under = self.game.board.grid[pawn_pos]
-        adj = [self.game.board.grid.get(n) for n in neighbors]
-        black_score = sum(1 for c in adj + [under] if c and c.color == "black")
-        white_score = sum(1 for c in adj + [under] if c and c.color == "white")
+        black_score, white_score = self.game.board.pawn_scores()
         print(f"Black score: {black_score}, White score: {white_score}")
         if black_score > white_score:
             winner = "Black"
@@ -335,10 +335,7 @@ class TrikeGUI:
         if self.game.pawn.position is None:
             if self.game.board.grid[(q, r)] is None:
                 print(f"First move by {self.game.players[self.game.current_player_index].color}")
-                self.game.board.place_checker(q, r, self.game.players[self.game.current_player_index])
-                self.game.pawn.position = (q, r)
-                self.game.board.pawn_position = (q, r)
-                self.game.first_move_done = True
+                self.game.play((q, r))
                 self.draw_board()
                 if self.game.pie_rule_available:
                     print("Offering pie rule to second player.")
@@ -351,25 +348,20 @@ class TrikeGUI:
                         )
                         if tkinter.messagebox.askyesno("Pie Rule", swap_msg):
                             print("Pie rule used: players swapped.")
-                            self.game.players.reverse()
-                            self.game.current_player_index = 1
+                            self.game.swap()
                         else:
                             print("Pie rule declined.")
-                            # Advance to Player 2 if pie rule declined
-                            self.game.current_player_index = 1
                     else:
                         # AI player 2 decides on pie rule (50% chance)
                         import random
                         if random.random() > 0.5:
                             print("AI used pie rule: players swapped.")
-                            self.game.players.reverse()
-                            self.game.current_player_index = 1
+                            self.game.swap()
                             self.status.config(text=f"{self.player_names[1]} (AI) used the pie rule!")
                             self.root.update()
                             time.sleep(1)  # Show the message briefly
                         else:
                             print("AI declined pie rule.")
-                            self.game.current_player_index = 1
                     
                     self.game.pie_rule_available = False
                     self.check_ai_turn()
@@ -386,14 +378,11 @@ class TrikeGUI:
             # Use backend's is_valid_move
             if self.game.board.is_valid_move(q_from, r_from, q, r):
                 print(f"Valid move by {self.game.players[self.game.current_player_index].color} to ({q}, {r})")
-                self.game.board.place_checker(q, r, self.game.players[self.game.current_player_index])
-                self.game.pawn.position = (q, r)
-                self.game.board.pawn_position = (q, r)
-                if self.game.board.is_pawn_trapped():
+                self.game.play((q, r))
+                if self.game.is_terminal():
                     print("Pawn is trapped. Game over.")
                     self.show_score()
                 else:
-                    self.game.current_player_index = (self.game.current_player_index + 1) % 2
                     print(f"Next turn: {self.game.players[self.game.current_player_index].color}")
                     self.draw_board()
                     # Check if it's an AI's turn now
@@ -406,10 +395,7 @@ class TrikeGUI:
         self.valid_moves.clear()
         if self.game.pawn.position is None:
             return
-        q_from, r_from = self.game.pawn.position
-        for (q, r) in self.game.board.grid:
-            if self.game.board.is_valid_move(q_from, r_from, q, r):
-                self.valid_moves.add((q, r))
+        self.valid_moves.update(self.game.board.legal_moves(*self.game.pawn.position))
     
     def update_player_name_from_ai(self, player_type, player_index):
         """Update player name field based on selected AI type"""
@@ -590,7 +576,7 @@ class TrikeGUI:
             elif ai_type == "MinimaxAI-Hard":
                 return MinimaxAI(depth=3, name=player_name)
             elif ai_type == "MCTSAI":
-                return MCTSAI(iterations=1000, name=player_name)
+                return MCTSAI(time_limit_ms=1000, name=player_name)
             else:
                 return None
         except Exception as e:
@@ -627,7 +613,7 @@ class TrikeGUI:
                 elif p1_type == "MinimaxAI-Hard":
                     self.ai_players[0] = MinimaxAI(depth=3, name=self.player_names[0])
                 elif p1_type == "MCTSAI":
-                    self.ai_players[0] = MCTSAI(iterations=1000, name=self.player_names[0])
+                    self.ai_players[0] = MCTSAI(time_limit_ms=1000, name=self.player_names[0])
                     
                 # Player 2 AI
                 p2_type = self.player2_type.get()
@@ -638,7 +624,7 @@ class TrikeGUI:
                 elif p2_type == "MinimaxAI-Hard": 
                     self.ai_players[1] = MinimaxAI(depth=3, name=self.player_names[1])
                 elif p2_type == "MCTSAI":
-                    self.ai_players[1] = MCTSAI(iterations=1000, name=self.player_names[1])
+                    self.ai_players[1] = MCTSAI(time_limit_ms=1000, name=self.player_names[1])
                 
                 # Update canvas dimensions
                 width = int(HEX_SIZE * 1.5 * size + HEX_SIZE * 2)
@@ -684,12 +670,7 @@ class TrikeGUI:
     
     def show_score(self):
         print("Calculating final score...")
-        pawn_pos = self.game.pawn.position
-        neighbors = self.game.board.get_neighbors(*pawn_pos)
-        under = self.game.board.grid[pawn_pos]
-        adj = [self.game.board.grid.get(n) for n in neighbors]
-        black_score = sum(1 for c in adj + [under] if c and c.color == "black")
-        white_score = sum(1 for c in adj + [under] if c and c.color == "white")
+        black_score, white_score = self.game.board.pawn_scores()
         print(f"Black score: {black_score}, White score: {white_score}")
         
         # Figure out which player is which color
@@ -844,6 +825,9 @@ class TrikeGUI:
     def reset_game(self):
         if self.game:
             self.game.reset()
+            for ai in self.ai_players:
+                if ai is not None:
+                    ai.reset()
             self.game_over = False
             self.status.config(text="Trike Game")
             self.draw_board()
@@ -927,12 +911,7 @@ class TrikeGUI:
                     q, r = ai.get_best_move(game_copy)
                 # Last resort - pick a random valid move
                 else:
-                    valid_moves = []
-                    q_from, r_from = self.game.pawn.position
-                    for (q_to, r_to) in self.game.board.grid:
-                        if self.game.board.is_valid_move(q_from, r_from, q_to, r_to):
-                            valid_moves.append((q_to, r_to))
-                    
+                    valid_moves = self.game.board.legal_moves(*self.game.pawn.position)
                     if valid_moves:
                         q, r = random.choice(valid_moves)
                     else:
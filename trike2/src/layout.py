@@ -0,0 +1,125 @@
+import random
+from functools import lru_cache
+from itertools import permutations
+
+from .checker import BLACK
+
+HEX_DIRECTIONS = [
+    (1, 0), (1, -1), (0, -1),
+    (-1, 0), (-1, 1), (0, 1)
+]
+
+
+class BoardLayout:
+    """
+    Fixed integer indexing of the cells of a triangular board.
+
+    Cells are numbered q-major (q, then r), so a board of side N has
+    N(N+1)/2 indices that can be used as bit positions or array slots.
+    Layouts are immutable and shared per size via get_layout().
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.coords = [(q, r) for q in range(size) for r in range(size - q)]
+        self.index = {pos: i for i, pos in enumerate(self.coords)}
+        self.num_cells = len(self.coords)
+        self.full_mask = (1 << self.num_cells) - 1
+
+        # Neighbour indices and the matching bitmask for every cell
+        self.neighbors = []
+        self.neighbor_masks = []
+        for q, r in self.coords:
+            cells = tuple(self.index[(q + dq, r + dr)] for dq, dr in HEX_DIRECTIONS
+                          if (q + dq, r + dr) in self.index)
+            mask = 0
+            for i in cells:
+                mask |= 1 << i
+            self.neighbors.append(cells)
+            self.neighbor_masks.append(mask)
+
+        # Straight-line rays walking outward from every cell, nearest first.
+        # Directions that leave the board immediately are omitted.
+        self.rays = []
+        for q, r in self.coords:
+            rays = []
+            for dq, dr in HEX_DIRECTIONS:
+                ray = []
+                pos = (q + dq, r + dr)
+                while pos in self.index:
+                    ray.append(self.index[pos])
+                    pos = (pos[0] + dq, pos[1] + dr)
+                if ray:
+                    rays.append(tuple(ray))
+            self.rays.append(tuple(rays))
+
+        # 64-bit Zobrist keys. The generator is seeded with the size so keys
+        # are identical across processes and runs.
+        rng = random.Random(size)
+        self.zobrist_black = [rng.getrandbits(64) for _ in range(self.num_cells)]
+        self.zobrist_white = [rng.getrandbits(64) for _ in range(self.num_cells)]
+        self.zobrist_pawn = [rng.getrandbits(64) for _ in range(self.num_cells)]
+        self.zobrist_side = rng.getrandbits(64)
+
+        # The triangle's six symmetries (the D3 group) as cell permutations.
+        # With the third coordinate s = N-1-q-r, every permutation of
+        # (q, r, s) maps the board, its neighbours and its lines onto itself.
+        # Symmetry 0 is the identity.
+        self.symmetries = []
+        for perm in permutations(range(3)):
+            table = []
+            for q, r in self.coords:
+                qrs = (q, r, size - 1 - q - r)
+                table.append(self.index[(qrs[perm[0]], qrs[perm[1]])])
+            self.symmetries.append(tuple(table))
+        self.inverse_symmetries = [
+            next(u for u, other in enumerate(self.symmetries)
+                 if all(other[table[i]] == i for i in range(self.num_cells)))
+            for table in self.symmetries
+        ]
+
+    def transform(self, pos, symmetry, inverse=False):
+        """Map a (q, r) cell through a symmetry, or back with inverse=True."""
+        if inverse:
+            symmetry = self.inverse_symmetries[symmetry]
+        return self.coords[self.symmetries[symmetry][self.index[pos]]]
+
+    def symmetric_keys(self, occupied, pawn_index):
+        """
+        Return the Zobrist key of a position under each symmetry.
+
+        occupied yields (cell index, colour code) pairs for the checkers on
+        the board. Entry 0 equals the board's own incremental key.
+        """
+        keys = [0] * len(self.symmetries)
+        for i, code in occupied:
+            table = self.zobrist_black if code == BLACK else self.zobrist_white
+            for t, perm in enumerate(self.symmetries):
+                keys[t] ^= table[perm[i]]
+        if pawn_index is not None:
+            for t, perm in enumerate(self.symmetries):
+                keys[t] ^= self.zobrist_pawn[perm[pawn_index]]
+        return keys
+
+    def canonical_key(self, occupied, pawn_index):
+        """
+        Return (key, symmetry) for the canonical orientation of a position.
+
+        The canonical orientation is the symmetry with the smallest key, so
+        all six mirror images of a position share one key. Map a move into
+        that orientation with transform(move, symmetry) and back with
+        inverse=True. Arguments are as for symmetric_keys().
+        """
+        keys = self.symmetric_keys(occupied, pawn_index)
+        key = min(keys)
+        return key, keys.index(key)
+
+    def __reduce__(self):
+        # Layouts are pure functions of the size; rebuild from the cache
+        return (get_layout, (self.size,))
+
+
+@lru_cache(maxsize=None)
+def get_layout(size):
+    """Return the shared BoardLayout for a board of the given size."""
+    return BoardLayout(size)
@@ -1,4 +1,6 @@
 class Pawn:
+    __slots__ = ("position",)
+
     def __init__(self, position=None):
         self.position = position
 
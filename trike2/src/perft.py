@@ -0,0 +1,114 @@
+import argparse
+import random
+import time
+
+from .bitboard import BitBoard
+from .board import Board
+from .game import Game
+
+BOARD_CLASSES = {"board": Board, "bitboard": BitBoard}
+PHASES = ("opening", "middlegame", "endgame")
+
+
+def perft(game, depth):
+    """
+    Count the positions reachable in exactly `depth` plies.
+
+    Moves are applied and taken back in place, so the count measures raw
+    move generation plus play/undo speed of the engine. Games that end
+    earlier contribute nothing, as a trapped pawn has no legal moves.
+    """
+    if depth == 0:
+        return 1
+    moves = game.legal_moves()
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        game.play(move)
+        nodes += perft(game, depth - 1)
+        game.undo()
+    return nodes
+
+
+def timed_perft(size, depth, board_class=Board):
+    """
+    Run perft from the empty board of the given size.
+
+    Returns:
+        tuple: (nodes, seconds, nodes_per_second)
+    """
+    game = Game(size, board_class)
+    start = time.perf_counter()
+    nodes = perft(game, depth)
+    elapsed = time.perf_counter() - start
+    return nodes, elapsed, nodes / elapsed if elapsed > 0 else float("inf")
+
+
+def branching_factors(size, games=100, board_class=Board, seed=None):
+    """
+    Measure the average branching factor per game phase over random games.
+
+    Each game's plies are split into thirds (opening, middlegame, endgame)
+    by that game's own length, so boards of different sizes are comparable.
+
+    Returns:
+        dict: Average number of legal moves per phase, plus the average
+              game length under "plies"
+    """
+    rng = random.Random(seed)
+    totals = dict.fromkeys(PHASES, 0)
+    counts = dict.fromkeys(PHASES, 0)
+    plies = 0
+    for _ in range(games):
+        game = Game(size, board_class)
+        history = []
+        while not game.is_terminal():
+            moves = game.legal_moves()
+            history.append(len(moves))
+            game.play(rng.choice(moves))
+        plies += len(history)
+        for ply, branching in enumerate(history):
+            phase = PHASES[ply * len(PHASES) // len(history)]
+            totals[phase] += branching
+            counts[phase] += 1
+    stats = {phase: totals[phase] / counts[phase] if counts[phase] else 0.0 for phase in PHASES}
+    stats["plies"] = plies / games if games else 0.0
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count Trike move trees and branching factors")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[7, 9, 11, 13, 15, 17, 19],
+                        help="Board sizes to measure")
+    parser.add_argument("--depth", type=int, default=3, help="Perft depth in plies")
+    parser.add_argument("--board", choices=sorted(BOARD_CLASSES), default="board",
+                        help="Board engine to measure")
+    parser.add_argument("--games", type=int, default=100,
+                        help="Random games sampled for branching factors (0 to skip)")
+    parser.add_argument("--verify", action="store_true",
+                        help="Check node counts against the reference Board")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for sampled games")
+    args = parser.parse_args()
+
+    board_class = BOARD_CLASSES[args.board]
+    print(f"{'size':>4} {'depth':>5} {'nodes':>12} {'seconds':>9} {'nodes/s':>11}  engine")
+    for size in args.sizes:
+        nodes, elapsed, rate = timed_perft(size, args.depth, board_class)
+        print(f"{size:>4} {args.depth:>5} {nodes:>12} {elapsed:>9.3f} {rate:>11.0f}  {board_class.__name__}")
+        if args.verify and board_class is not Board:
+            expected = perft(Game(size), args.depth)
+            if expected != nodes:
+                raise SystemExit(f"Node count mismatch at size {size}: Board gives {expected}")
+
+    if args.games:
+        print(f"\nAverage branching factor over {args.games} random games")
+        print(f"{'size':>4} " + " ".join(f"{phase:>10}" for phase in PHASES) + f" {'plies':>7}")
+        for size in args.sizes:
+            stats = branching_factors(size, args.games, board_class, args.seed)
+            print(f"{size:>4} " + " ".join(f"{stats[phase]:>10.2f}" for phase in PHASES)
+                  + f" {stats['plies']:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 class Player:
+    __slots__ = ("color",)
+
     def __init__(self, color):
         self.color = color
 
@@ -0,0 +1,176 @@
+import argparse
+import random
+import threading
+import time
+from array import array
+
+from .checker import BLACK, COLOR_CODES, WHITE
+from .layout import get_layout
+
+_local = threading.local()
+
+
+class PlayoutKernel:
+    """
+    Fast random playouts on a flat scratch copy of the board.
+
+    The kernel copies the colour codes of a Game into a reusable array,
+    then plays uniformly random moves by walking the precomputed ray tables
+    until the pawn has no moves left. The Game itself is never modified.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.layout = get_layout(size)
+        # Scratch buffers reused by every playout on this kernel
+        self.cells = array('b', bytes(self.layout.num_cells))
+        self.moves = [0] * self.layout.num_cells
+        # Cell indices played by the last run, in order
+        self.played = []
+        # Whether the last run reached a trapped pawn rather than a cutoff
+        self.finished = True
+
+    def run(self, game, rng=random, max_plies=None, region_limit=None):
+        """
+        Play random moves from the game's position to the end or a cutoff.
+
+        Args:
+            game: Game to start from (left untouched)
+            rng: Source of randomness with a random() method
+            max_plies: Stop after this many moves, if set
+            region_limit: Stop once the empty region around the pawn has at
+                most this many cells, if set
+
+        Returns:
+            tuple: (player1_score, player2_score) around the pawn where the
+                   playout stopped; `finished` tells whether it was the end.
+                   After a cutoff they are Game.cutoff_scores() instead of
+                   scores().
+        """
+        cells = self.cells
+        cells[:] = game.board.cells
+        moves = self.moves
+        rays = self.layout.rays
+        rand = rng.random
+        played = self.played
+        played.clear()
+        self.finished = False
+        color = COLOR_CODES[game.players[game.current_player_index].color]
+        pawn = start = game.board.pawn_index
+
+        if pawn is None:
+            # First move: any empty cell
+            n = 0
+            for i in range(len(cells)):
+                if not cells[i]:
+                    moves[n] = i
+                    n += 1
+            if n == 0:
+                self.finished = True
+                return 0, 0
+            pawn = moves[int(rand() * n)]
+            cells[pawn] = color
+            played.append(pawn)
+            color = BLACK + WHITE - color
+
+        while True:
+            n = 0
+            for ray in rays[pawn]:
+                for i in ray:
+                    if cells[i]:
+                        break
+                    moves[n] = i
+                    n += 1
+            if n == 0:
+                self.finished = True
+                break
+            if max_plies is not None and len(played) >= max_plies:
+                break
+            if region_limit is not None and n <= region_limit and self._region_size(pawn, region_limit) <= region_limit:
+                break
+            pawn = moves[int(rand() * n)]
+            cells[pawn] = color
+            played.append(pawn)
+            color = BLACK + WHITE - color
+
+        black = white = 0
+        scored = self.layout.neighbors[pawn]
+        if self.finished:
+            scored += (pawn,)
+        else:
+            # As Game.cutoff_scores: leave out the cell under the pawn and
+            # the one it came from
+            if len(played) >= 2:
+                previous = played[-2]
+            elif played:
+                previous = start
+            else:
+                previous = game.move_stack[-1][1] if game.move_stack else None
+                previous = None if previous is None else self.layout.index[previous]
+            if previous in scored:
+                scored = tuple(i for i in scored if i != previous)
+        for i in scored:
+            if cells[i] == BLACK:
+                black += 1
+            elif cells[i] == WHITE:
+                white += 1
+        if game.players[0].color == "black":
+            return black, white
+        return white, black
+
+    def _region_size(self, pawn, limit):
+        """Count the empty cells connected to the pawn, stopping past `limit`."""
+        cells = self.cells
+        neighbors = self.layout.neighbors
+        stack = [i for i in neighbors[pawn] if not cells[i]]
+        seen = set(stack)
+        while stack and len(seen) <= limit:
+            for j in neighbors[stack.pop()]:
+                if not cells[j] and j not in seen:
+                    seen.add(j)
+                    stack.append(j)
+        return len(seen)
+
+
+def get_kernel(size):
+    """Return this thread's shared PlayoutKernel for a board size."""
+    kernels = getattr(_local, "kernels", None)
+    if kernels is None:
+        kernels = _local.kernels = {}
+    kernel = kernels.get(size)
+    if kernel is None:
+        kernel = kernels[size] = PlayoutKernel(size)
+    return kernel
+
+
+def playouts_per_second(size, playout, seconds=1.0, seed=None):
+    """Time a playout function from the empty board and return playouts/sec."""
+    from .game import Game
+    rng = random.Random(seed)
+    game = Game(size)
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        playout(game, rng)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark random playouts")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[7, 13, 19], help="Board sizes")
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time per measurement")
+    args = parser.parse_args()
+
+    from .engine import GameEngine
+    print(f"{'size':>4} {'generic/s':>10} {'kernel/s':>10} {'speedup':>8}")
+    for size in args.sizes:
+        generic = playouts_per_second(size, lambda game, rng: GameEngine.truncated_playout(game, rng),
+                                      args.seconds, seed=1)
+        kernel = playouts_per_second(size, lambda game, rng: get_kernel(size).run(game, rng),
+                                     args.seconds, seed=1)
+        print(f"{size:>4} {generic:>10.0f} {kernel:>10.0f} {kernel / generic:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
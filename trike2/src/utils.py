@@ -29,15 +29,10 @@ def calculate_score(board, color, pawn_position):
     - 1 point for each checker of their color adjacent to or underneath the pawn.
     """
     q, r = pawn_position
-    score = 0
+    black, white = board.neighbor_counts(q, r)
+    score = black if color == "black" else white
     # Underneath the pawn
     checker = board.grid.get((q, r))
     if checker is not None and getattr(checker, "color", None) == color:
         score += 1
-    # Adjacent checkers
-    for dq, dr in board.HEX_DIRECTIONS:
-        pos = (q + dq, r + dr)
-        checker = board.grid.get(pos)
-        if checker is not None and getattr(checker, "color", None) == color:
-            score += 1
     return score
\ No newline at end of file
@@ -0,0 +1,362 @@
+import os
+import random
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from src.bitboard import BitBoard
+from src.board import Board
+from src.game import Game
+from trike_ai.agents import (RandomAI, MinimaxAI, MCTSAI, RootParallelMCTSAI, TreeParallelMCTSAI, CompactMCTSAI,
+                             OpeningStats)
+from trike_ai.agents.mcts_ai import outcome, rollout_value
+from trike_ai.training.runner import run_ai_match
+
+
+def opened_game(size=7):
+    """Return a game of the given size after a first move off the centre."""
+    game = Game(size)
+    game.play((size // 2, size // 4))
+    return game
+
+
+def random_games(size, plies, count, seed):
+    """Yield up to `count` games played `plies` random moves deep, skipping finished ones."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        game = Game(size)
+        while game.ply() < plies and not game.is_terminal():
+            game.play(rng.choice(game.legal_moves()))
+        if not game.is_terminal():
+            yield game
+
+
+class FakeClock:
+    """Stands in for the time module: perf_counter() advances `step` seconds per call."""
+
+    def __init__(self, step=0.001):
+        self.now = 0.0
+        self.step = step
+
+    def perf_counter(self):
+        self.now += self.step
+        return self.now
+
+
+def solve(game):
+    """Exact result, 1, 0.5 or 0, for the player to move."""
+    if game.is_terminal():
+        value = outcome(game.scores())
+        return value if game.to_move() == 0 else 1 - value
+    best = 0
+    for move in game.legal_moves():
+        game.play(move)
+        best = max(best, 1 - solve(game))
+        game.undo()
+    return best
+
+
+class TestAgents(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+
+    def choose(self, agent, game):
+        """Let the agent pick a move in the game and check that it is legal."""
+        move = agent.choose_move(game)
+        self.assertIn(move, game.legal_moves())
+        return move
+
+    def test_matches_finish_on_both_boards(self):
+        for board_class in (Board, BitBoard):
+            agents = [RandomAI(), MinimaxAI(depth=2), MCTSAI(iterations=20), CompactMCTSAI(iterations=20)]
+            for agent1, agent2 in zip(agents, agents[1:] + agents[:1]):
+                winner, scores = run_ai_match(agent1, agent2, board_size=7, verbose=False,
+                                              board_class=board_class)
+                self.assertIn(winner, (agent1.name, agent2.name, "Draw"))
+                self.assertEqual(len(scores), 2)
+
+    def test_search_leaves_game_untouched(self):
+        game = opened_game()
+        key = game.key()
+        for agent in (MinimaxAI(depth=2), MCTSAI(iterations=30), CompactMCTSAI(iterations=30)):
+            self.choose(agent, game)
+            self.assertEqual(game.key(), key)
+            self.assertEqual(game.ply(), 1)
+
+    def test_mcts_reuses_subtree(self):
+        game = opened_game()
+        agent = MCTSAI(iterations=200)
+        move = agent.choose_move(game)
+        child = next(c for c in agent.root.children if c.move == move)
+        reply = max(child.children, key=lambda c: c.visits)
+        visits = reply.visits
+        game.play(move)
+        game.play(reply.move)
+        agent.choose_move(game)
+        self.assertEqual(agent.search_stats["reused_visits"], visits)
+        self.assertIs(agent.root, reply)
+        self.assertIsNone(agent.root.parent)
+        self.assertEqual(agent.root.visits, visits + 200)
+        agent.reset()
+        self.assertIsNone(agent.root)
+
+    def test_mcts_time_limit(self):
+        game = opened_game(13)
+        agent = MCTSAI(time_limit_ms=50)
+        # One clock reading per iteration past the first, 1 ms apart
+        with mock.patch('trike_ai.agents.mcts_ai.time', FakeClock()):
+            self.choose(agent, game)
+        self.assertGreaterEqual(agent.search_stats["iterations"], 45)
+        self.assertGreaterEqual(agent.search_stats["elapsed_ms"], 50)
+        self.assertLessEqual(agent.search_stats["elapsed_ms"], 52)
+
+    def test_root_parallel_merges_workers(self):
+        game = opened_game()
+        agent = RootParallelMCTSAI(iterations=50, workers=2, seed=1)
+        try:
+            stats = agent.root_statistics(game)
+            self.assertEqual(sum(visits for visits, _ in stats.values()), 100)
+            self.assertEqual(agent.search_stats["iterations"], 100)
+            pool = agent.pool
+            self.choose(agent, game)
+            self.assertIs(agent.pool, pool)
+        finally:
+            agent.close()
+        self.assertIsNone(agent.pool)
+        # Resetting between games shuts the pool down too
+        agent.root_statistics(game)
+        agent.reset()
+        self.assertIsNone(agent.pool)
+
+    def test_tree_parallel_backs_up_every_leaf(self):
+        game = opened_game()
+        with TreeParallelMCTSAI(iterations=40, workers=2, leaves_per_task=3, seed=1) as agent:
+            move = agent.choose_move(game)
+        self.assertIsNone(agent.pool)
+        self.assertIn(move, game.legal_moves())
+        self.assertEqual(agent.search_stats["iterations"], 40)
+        self.assertEqual(agent.root.visits, 40)
+        nodes = [agent.root]
+        while nodes:
+            node = nodes.pop()
+            self.assertEqual(node.virtual_loss, 0)
+            nodes.extend(node.children)
+
+    def test_compact_tree_statistics(self):
+        game = opened_game()
+        agent = CompactMCTSAI(iterations=300)
+        self.choose(agent, game)
+        tree = agent.tree
+        self.assertEqual(tree.visits[0], 300)
+        self.assertEqual(agent.search_stats["nodes"], len(tree))
+        for node in range(len(tree)):
+            children = tree.children(node)
+            if children and tree.visits[node] > 1:
+                # Every visit after the expanding one went to a child
+                self.assertEqual(sum(tree.visits[c] for c in children), tree.visits[node] - (node != 0))
+            for child in children:
+                self.assertEqual(tree.parent[child], node)
+        self.assertEqual(agent.state.key(), game.key())
+
+    def test_mcts_transpositions_share_nodes(self):
+        game = Game(5)
+        game.play((1, 1))
+        agent = MCTSAI(iterations=1000, transpositions=True)
+        self.choose(agent, game)
+        root = agent.root
+        self.assertIs(agent.table[game.key()], root)
+        self.assertEqual(sum(root.edge_visits.values()), 1000)
+        # Some positions were reached by more than one move order
+        links = sum(len(node.children) for node in agent.table.values())
+        self.assertGreater(links, len(agent.table) - 1)
+        # Two orders of the same moves end on one shared node
+        nodes = []
+        for moves in ([(2, 1), (3, 0), (3, 1), (2, 2)], [(3, 1), (3, 0), (2, 1), (2, 2)]):
+            state = game.clone()
+            for move in moves:
+                state.play(move)
+            nodes.append(agent._make_node(state, move=moves[-1]))
+        self.assertIs(nodes[0], nodes[1])
+        agent.reset()
+        self.assertEqual(agent.table, {})
+
+    def test_mcts_transpositions_prune_table(self):
+        game = Game(5)
+        game.play((1, 1))
+        agent = MCTSAI(iterations=500, transpositions=True)
+        move = self.choose(agent, game)
+        old_table = agent.table
+        game.play(move)
+        game.play(game.legal_moves()[0])
+        self.choose(agent, game)
+        # The table holds exactly the nodes below the reused root
+        reachable = {id(agent.root)}
+        level = [agent.root]
+        while level:
+            level = [child for node in level for child in node.children if id(child) not in reachable]
+            reachable.update(id(node) for node in level)
+        self.assertEqual({id(node) for node in agent.table.values()}, reachable)
+        # Siblings of the moves played were dropped
+        dropped = [node for node in old_table.values() if node.game_state.ply() == 2 and node.move != move]
+        self.assertTrue(dropped)
+        self.assertFalse(any(id(node) in reachable for node in dropped))
+
+    def test_mcts_rave_statistics(self):
+        game = opened_game()
+        agent = MCTSAI(iterations=300, rave=True)
+        self.choose(agent, game)
+        root = agent.root
+        for child in root.children:
+            # Every visit through a child played its move first
+            visits, wins = root.amaf[child.move]
+            self.assertGreaterEqual(visits, child.visits)
+            self.assertLessEqual(wins, visits)
+        # Occupied cells are never credited
+        self.assertNotIn((3, 1), root.amaf)
+
+    def test_mcts_rollout_cutoff(self):
+        game = opened_game(13)
+        agent = MCTSAI(iterations=100, rollout_plies=4)
+        self.choose(agent, game)
+        self.assertEqual(agent.root.visits, 100)
+        # Static evaluations give fractional credit
+        self.assertTrue(any(child.wins != int(child.wins) and child.wins * 2 != int(child.wins * 2)
+                            for child in agent.root.children))
+        agent = MCTSAI(iterations=100, rollout_region=10)
+        self.choose(agent, game)
+
+    def test_rollout_cutoff_ignores_parity(self):
+        game = opened_game(13)
+        rng = random.Random(0)
+        means = [sum(rollout_value(game, rng, max_plies=plies) for _ in range(2000)) / 2000
+                 for plies in (10, 11)]
+        # Cutting off after the other player's move must not favour them
+        self.assertAlmostEqual(means[0], means[1], delta=0.08)
+
+    def test_mcts_solver_proves_endgames(self):
+        for game in random_games(6, 6, 3, seed=4):
+            agent = MCTSAI(iterations=20000, solver=True)
+            move = agent.choose_move(game)
+            self.assertIsNotNone(agent.search_stats["proven"])
+            self.assertLess(agent.search_stats["iterations"], 20000)
+            # Proven values are for the player who moved into the root
+            self.assertEqual(1 - agent.search_stats["proven"], solve(game))
+            game.play(move)
+            self.assertEqual(solve(game), agent.search_stats["proven"])
+
+    def test_mcts_vectorized_selection(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        game = opened_game(13)
+        agent = MCTSAI(iterations=600, vectorized=True)
+        agent.vector_min_children = 4
+        self.choose(agent, game)
+        root = agent.root
+        self.assertEqual(list(root.child_visits), [child.visits for child in root.children])
+        self.assertEqual(list(root.child_wins), [child.wins for child in root.children])
+        self.assertIs(root.select_child_vectorized(), root.select_child())
+
+    def test_mcts_early_stop(self):
+        # A position with a single legal move: the leader is clear at once
+        rng = random.Random(2)
+        while True:
+            game = Game(7)
+            while not game.is_terminal() and len(game.legal_moves()) > 1:
+                game.play(rng.choice(game.legal_moves()))
+            if not game.is_terminal():
+                break
+        agent = MCTSAI(iterations=1000, early_stop=True)
+        self.assertEqual(agent.choose_move(game), game.legal_moves()[0])
+        stats = agent.search_stats
+        self.assertGreater(stats["saved_iterations"], 0)
+        self.assertEqual(stats["iterations"] + stats["saved_iterations"], 1000)
+        root = agent.root
+        self.assertGreater(root.children[0].visits, stats["saved_iterations"])
+
+        agent = MCTSAI(time_limit_ms=200, early_stop=True)
+        with mock.patch('trike_ai.agents.mcts_ai.time', FakeClock()):
+            agent.choose_move(game)
+        stats = agent.search_stats
+        self.assertGreater(stats["saved_ms"], 0)
+        self.assertAlmostEqual(stats["elapsed_ms"] + stats["saved_ms"], 200, delta=2)
+
+    def test_mcts_opening_stats(self):
+        path = os.path.join(tempfile.mkdtemp(), "opening.db")
+        game = opened_game()
+        store = OpeningStats(path, max_plies=3)
+        agent = MCTSAI(iterations=300, opening_stats=store)
+        self.choose(agent, game)
+        child = max(agent.root.children, key=lambda c: c.visits)
+        agent.reset()
+        store.close()
+
+        # A fresh store reads the statistics back, for the mirror image too
+        store = OpeningStats(path, max_plies=3, max_prior=1000)
+        self.assertEqual(store.lookup(child.game_state), (child.visits, child.wins))
+        mirror = Game(7)
+        for move in ((3, 1), child.move):
+            mirror.play(game.transform_move(move, 1))
+        self.assertEqual(store.lookup(mirror), (child.visits, child.wins))
+
+        agent = MCTSAI(iterations=100, opening_stats=store)
+        agent.search(game)
+        seeded = next(c for c in agent.root.children if c.move == child.move)
+        self.assertGreaterEqual(seeded.visits, child.visits)
+        # Positions past max_plies are neither seeded nor stored
+        self.assertTrue(all(grandchild.stored is None or grandchild.game_state.ply() <= 3
+                            for c in agent.root.children for grandchild in c.children))
+        agent.reset()
+        store.close()
+        store = OpeningStats(path, max_plies=3, max_prior=1000)
+        visits, _ = store.lookup(child.game_state)
+        self.assertEqual(visits, seeded.visits)
+        store.close()
+
+    def test_opening_stats_across_threads(self):
+        # As in the GUI: every move is searched on a new thread and the
+        # agent is reset from another one
+        path = os.path.join(tempfile.mkdtemp(), "opening.db")
+        store = OpeningStats(path, max_plies=4)
+        agent = MCTSAI(iterations=100, opening_stats=store)
+        game = opened_game()
+        errors = []
+
+        def search():
+            try:
+                game.play(agent.choose_move(game))
+            except Exception as error:
+                errors.append(error)
+
+        for _ in range(2):
+            thread = threading.Thread(target=search)
+            thread.start()
+            thread.join()
+        self.assertEqual(errors, [])
+        agent.reset()
+        self.assertEqual(store.pending, {})
+        store.close()
+
+    def test_minimax_iterative_deepening(self):
+        game = opened_game(19)
+        agent = MinimaxAI(time_limit_ms=100)
+        # The deadline is read every 256 nodes, 1 ms apart on this clock
+        with mock.patch('trike_ai.agents.minimax_ai.time', FakeClock()):
+            self.choose(agent, game)
+        self.assertGreaterEqual(agent.search_stats["depth"], 1)
+        self.assertLessEqual(agent.search_stats["elapsed_ms"], 102)
+        self.assertEqual(game.ply(), 1)
+
+        # Small endgames are searched to the end well within the limit
+        for game in random_games(6, 6, 3, seed=4):
+            agent = MinimaxAI(time_limit_ms=10000)
+            move = agent.choose_move(game)
+            self.assertLess(agent.search_stats["elapsed_ms"], 10000)
+            value = solve(game)
+            game.play(move)
+            self.assertEqual(1 - solve(game), value)
+
+if __name__ == '__main__':
+    unittest.main()
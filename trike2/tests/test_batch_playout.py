@@ -0,0 +1,65 @@
+import random
+import unittest
+from src.game import Game
+
+try:
+    import numpy as np
+    from src.batch_playout import BatchSimulator
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBatchSimulator(unittest.TestCase):
+
+    def random_positions(self, size, count, seed):
+        rng = random.Random(seed)
+        games = []
+        for _ in range(count):
+            game = Game(size)
+            for _ in range(rng.randrange(6)):
+                if game.is_terminal():
+                    break
+                game.play(rng.choice(game.legal_moves()))
+            games.append(game)
+        return games
+
+    def test_legal_masks_match_engine(self):
+        games = self.random_positions(7, 30, seed=4)
+        simulator = BatchSimulator(7, seed=0)
+        simulator.load(games)
+        masks = simulator.legal_masks()
+        coords = simulator.layout.coords
+        for game, mask in zip(games, masks):
+            self.assertEqual(sorted(coords[i] for i in np.flatnonzero(mask)),
+                             sorted(game.legal_moves()))
+
+    def test_simulate_plays_to_the_end(self):
+        simulator = BatchSimulator(7, seed=1)
+        scores = simulator.simulate(200)
+        self.assertEqual(scores.shape, (200, 2))
+        self.assertFalse(simulator.active.any())
+        self.assertFalse(simulator.legal_masks().any())
+        self.assertTrue((simulator.first_move >= 0).all())
+        self.assertTrue((scores.sum(axis=1) <= 7).all())
+
+    def test_run_from_loaded_positions(self):
+        games = self.random_positions(7, 20, seed=9)
+        # A finished game after the pie rule scores by the swapped players
+        finished = Game(7)
+        finished.play((0, 1))
+        finished.swap()
+        for move in [(1, 0), (0, 0)]:
+            finished.play(move)
+        games.append(finished)
+        keys = [game.key() for game in games]
+        simulator = BatchSimulator(7, seed=2)
+        simulator.load(games)
+        results = simulator.run()
+        self.assertEqual(results.shape, (len(games), 2))
+        self.assertEqual([game.key() for game in games], keys)
+        for game, result in zip(games, results):
+            if game.is_terminal():
+                self.assertEqual(tuple(result), game.scores())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import random
+import unittest
+from src.board import Board
+from src.bitboard import BitBoard
+from src.checker import Checker
+from src.game import Game
+
+class TestBitBoard(unittest.TestCase):
+
+    def setUp(self):
+        self.board = BitBoard(size=7)
+
+    def test_grid_adapter(self):
+        self.assertEqual(len(self.board.grid), 28)
+        self.assertEqual(list(self.board.grid), list(Board(7).grid))
+        self.assertTrue(self.board.place_checker(1, 1, Checker(color='white')))
+        self.assertEqual(self.board.grid[(1, 1)].color, 'white')
+        self.assertIsNone(self.board.grid.get((0, 0)))
+        self.assertIsNone(self.board.grid.get((9, 9)))
+
+    def test_place_on_occupied(self):
+        self.assertTrue(self.board.place_checker(1, 1, Checker(color='black')))
+        self.assertFalse(self.board.place_checker(1, 1, Checker(color='white')))
+        self.assertEqual(self.board.grid[(1, 1)].color, 'black')
+
+    def test_check_trap(self):
+        for pos in [(0, 0), (0, 1), (1, 0)]:
+            self.board.place_checker(*pos, Checker(color='white'))
+        self.board.pawn_position = (0, 0)
+        self.assertTrue(self.board.is_pawn_trapped())
+
+    def test_matches_reference_board(self):
+        rng = random.Random(7)
+        for size in (7, 10):
+            reference, bitboard = Board(size), BitBoard(size)
+            pos = rng.choice(list(reference.grid))
+            while True:
+                checker = Checker(rng.choice(['black', 'white']))
+                reference.place_checker(*pos, checker)
+                bitboard.place_checker(*pos, checker)
+                reference.pawn_position = bitboard.pawn_position = pos
+                self.assertEqual(bitboard.is_pawn_trapped(), reference.is_pawn_trapped())
+                self.assertEqual(bitboard.pawn_scores(), reference.pawn_scores())
+                self.assertEqual(bitboard.pawn_liberties(), reference.pawn_liberties())
+                moves = [cell for cell in reference.grid if reference.is_valid_move(*pos, *cell)]
+                self.assertEqual(moves, [cell for cell in bitboard.grid if bitboard.is_valid_move(*pos, *cell)])
+                if not moves:
+                    break
+                pos = rng.choice(moves)
+            self.assertEqual({p: getattr(c, 'color', None) for p, c in reference.grid.items()},
+                             {p: getattr(c, 'color', None) for p, c in bitboard.grid.items()})
+
+    def test_game_uses_board_class(self):
+        game = Game(7, board_class=BitBoard)
+        self.assertIsInstance(game.board, BitBoard)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
-from src.board import Board
-from src.checker import Checker
+from src.board import Board, BoardBase
+from src.checker import BLACK, EMPTY, WHITE, Checker
+from src.utils import calculate_score
 
 class TestBoard(unittest.TestCase):
 
@@ -40,5 +41,64 @@ class TestBoard(unittest.TestCase):
         self.board.pawn_position = (1, 1)
         self.assertFalse(self.board.is_valid_move(1, 1, 1, 2))  # Cannot move to occupied space
 
+    def test_legal_moves_stop_at_first_checker(self):
+        self.board.place_checker(2, 2, Checker(color='black'))
+        self.board.place_checker(2, 4, Checker(color='white'))
+        moves = self.board.legal_moves(2, 2)
+        self.assertIn((2, 3), moves)
+        self.assertNotIn((2, 4), moves)  # Blocked cell
+        self.assertNotIn((2, 5), moves)  # Cannot jump over it
+
+    def test_legal_moves_match_is_valid_move(self):
+        for pos in [(0, 0), (1, 1), (2, 2), (3, 0)]:
+            self.board.place_checker(*pos, Checker(color='white'))
+        for q, r in self.board.grid:
+            expected = {cell for cell in self.board.grid if self.board.is_valid_move(q, r, *cell)}
+            self.assertEqual(set(self.board.legal_moves(q, r)), expected)
+
+    def test_empty_neighbor_counts(self):
+        self.board.place_checker(0, 0, Checker(color='white'))
+        self.board.pawn_position = (0, 0)
+        self.assertEqual(self.board.pawn_liberties(), 2)
+        self.board.place_checker(0, 1, Checker(color='black'))
+        self.assertEqual(self.board.pawn_liberties(), 1)  # One liberty left
+        self.board.place_checker(1, 0, Checker(color='black'))
+        self.assertTrue(self.board.is_pawn_trapped())
+        self.board.remove_checker(1, 0)
+        self.assertFalse(self.board.is_pawn_trapped())
+        self.assertEqual(self.board.empty_neighbors, self.board.count_empty_neighbors())
+
+    def test_neighbor_counts_and_pawn_scores(self):
+        self.board.place_checker(2, 2, Checker(color='white'))
+        self.board.place_checker(3, 2, Checker(color='black'))
+        self.board.place_checker(2, 1, Checker(color='black'))
+        self.board.place_checker(1, 2, Checker(color='white'))
+        self.board.pawn_position = (2, 2)
+        self.assertEqual(self.board.neighbor_counts(2, 2), (2, 1))
+        self.assertEqual(self.board.pawn_scores(), (2, 2))  # Checker underneath counts
+        self.board.remove_checker(3, 2)
+        self.assertEqual(self.board.pawn_scores(), (1, 2))
+        self.assertEqual(calculate_score(self.board, 'white', (2, 2)), 2)
+
+    def test_cells_store_color_codes(self):
+        self.board.place_checker(1, 1, Checker(color='white'))
+        self.board.place_checker(1, 2, BLACK)
+        index = self.board.layout.index
+        self.assertEqual(self.board.cells[index[(1, 1)]], WHITE)
+        self.assertEqual(self.board.cells[index[(1, 2)]], BLACK)
+        self.assertEqual(self.board.cells[index[(0, 0)]], EMPTY)
+        self.assertEqual(self.board.grid[(1, 2)].color, 'black')
+        copy = self.board.copy()
+        copy.remove_checker(1, 2)
+        self.assertEqual(self.board.grid[(1, 2)].color, 'black')
+        self.assertIsNone(copy.grid[(1, 2)])
+
+    def test_board_base_requires_occupied_cells(self):
+        class IncompleteBoard(BoardBase):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteBoard()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
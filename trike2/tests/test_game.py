@@ -1,4 +1,7 @@
 import unittest
+from src.bitboard import BitBoard
+from src.board import Board
+from src.engine import GameEngine
 from src.game import Game
 from src.player import Player
 
@@ -56,5 +59,135 @@ class TestGame(unittest.TestCase):
         self.game.make_move(self.player2, (1, 6))
         self.assertTrue(self.game.is_game_over())
 
+class TestGamePlayUndo(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(7)
+
+    def snapshot(self):
+        grid = {pos: getattr(c, 'color', None) for pos, c in self.game.board.grid.items()}
+        return (grid, self.game.pawn.position, self.game.board.pawn_position,
+                self.game.current_player_index, self.game.first_move_done,
+                self.game.pie_rule_available)
+
+    def test_play_places_checker_and_passes_turn(self):
+        self.game.play((2, 2))
+        self.assertEqual(self.game.board.grid[(2, 2)].color, 'white')
+        self.assertEqual(self.game.pawn.position, (2, 2))
+        self.assertEqual(self.game.current_player_index, 1)
+        self.assertTrue(self.game.pie_rule_available)
+        self.game.play((2, 3))
+        self.assertEqual(self.game.board.grid[(2, 3)].color, 'black')
+        self.assertFalse(self.game.pie_rule_available)
+
+    def test_undo_restores_previous_state(self):
+        snapshots = []
+        for move in [(2, 2), (2, 3), (0, 3), (0, 0)]:
+            snapshots.append(self.snapshot())
+            self.game.play(move)
+        while snapshots:
+            self.game.undo()
+            self.assertEqual(self.snapshot(), snapshots.pop())
+
+    def test_play_rejects_occupied_cell(self):
+        self.game.play((2, 2))
+        with self.assertRaises(ValueError):
+            self.game.play((2, 2))
+
+    def test_play_undo_on_bitboard(self):
+        self.game = Game(7, board_class=BitBoard)
+        before = self.snapshot()
+        self.game.play((1, 1))
+        self.game.play((1, 4))
+        self.game.undo()
+        self.game.undo()
+        self.assertEqual(self.snapshot(), before)
+
+    def test_position_key_is_incremental(self):
+        empty_key = self.game.position_key()
+        self.game.play((2, 2))
+        self.assertNotEqual(self.game.position_key(), empty_key)
+        self.game.undo()
+        self.assertEqual(self.game.position_key(), empty_key)
+
+    def test_position_key_matches_transpositions(self):
+        keys = []
+        for board_class in (Board, BitBoard):
+            for moves in ([(2, 2), (0, 2), (2, 0), (4, 0)], [(2, 0), (0, 2), (2, 2), (4, 0)]):
+                game = Game(7, board_class=board_class)
+                for move in moves:
+                    game.play(move)
+                keys.append(game.position_key())
+        self.assertEqual(len(set(keys)), 1)
+        game.undo()
+        self.assertNotIn(game.position_key(), keys)
+
+class TestGameEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(7)
+
+    def test_implements_interface(self):
+        self.assertIsInstance(self.game, GameEngine)
+        self.assertEqual(len(self.game.legal_moves()), 28)  # Any cell on the first move
+        self.assertEqual(self.game.ply(), 0)
+
+    def test_clone_is_independent(self):
+        self.game.play((2, 2))
+        clone = self.game.clone()
+        clone.play((2, 3))
+        self.assertEqual(self.game.ply(), 1)
+        self.assertIsNone(self.game.board.grid[(2, 3)])
+        self.assertEqual(clone.key(), Game.clone(clone).key())
+        clone.undo()
+        self.assertEqual(clone.key(), self.game.key())
+
+    def test_scores_follow_players(self):
+        for move in [(0, 1), (1, 0), (0, 0)]:
+            self.game.play(move)
+        self.assertTrue(self.game.is_terminal())
+        self.assertEqual(self.game.scores(), (2, 1))  # White (player 0) holds two cells
+        self.game.swap()
+        self.assertEqual(self.game.scores(), (1, 2))
+
+    def test_pie_rule_window(self):
+        self.assertFalse(self.game.can_swap())
+        self.game.play((3, 1))
+        self.assertTrue(self.game.can_swap())
+        self.game.swap()
+        self.assertFalse(self.game.can_swap())
+        self.assertEqual(self.game.players[0].color, 'black')
+
+class TestGameSymmetry(unittest.TestCase):
+
+    moves = [(1, 1), (1, 4), (3, 2), (0, 2)]
+
+    def test_mirrored_games_share_canonical_key(self):
+        game = Game(7)
+        for move in self.moves:
+            game.play(move)
+        key, symmetry = game.canonical_key()
+        for t in range(6):
+            for board_class in (Board, BitBoard):
+                mirror = Game(7, board_class=board_class)
+                for move in self.moves:
+                    mirror.play(game.transform_move(move, t))
+                self.assertEqual(mirror.canonical_key()[0], key)
+        self.assertEqual(game.board.symmetric_keys()[0], game.board.zobrist)
+
+    def test_transform_round_trip(self):
+        layout = Game(9).board.layout
+        for t in range(6):
+            for pos in layout.coords:
+                self.assertEqual(layout.transform(layout.transform(pos, t), t, inverse=True), pos)
+
+    def test_unique_moves_on_symmetric_positions(self):
+        game = Game(7)
+        self.assertEqual(len(game.unique_moves(game.legal_moves())), 7)
+        game.play((2, 2))  # Centre cell keeps every symmetry
+        self.assertEqual(len(game.unique_moves(game.legal_moves())), 2)
+        game.play((2, 3))
+        self.assertEqual(game.unique_moves(game.legal_moves()), game.legal_moves())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
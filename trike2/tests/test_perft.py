@@ -0,0 +1,32 @@
+import unittest
+from src.bitboard import BitBoard
+from src.game import Game
+from src.perft import PHASES, branching_factors, perft
+
+class TestPerft(unittest.TestCase):
+
+    def test_shallow_counts(self):
+        game = Game(7)
+        self.assertEqual(perft(game, 0), 1)
+        self.assertEqual(perft(game, 1), 28)  # Any cell on the first move
+        expected = 0
+        for move in game.legal_moves():
+            game.play(move)
+            expected += len(game.legal_moves())
+            game.undo()
+        self.assertEqual(perft(game, 2), expected)
+        self.assertEqual(game.ply(), 0)
+
+    def test_engines_agree(self):
+        for size in (7, 8):
+            self.assertEqual(perft(Game(size), 3), perft(Game(size, board_class=BitBoard), 3))
+
+    def test_branching_factors(self):
+        stats = branching_factors(7, games=5, seed=1)
+        for phase in PHASES:
+            self.assertGreater(stats[phase], 0)
+        self.assertGreater(stats['opening'], stats['endgame'])
+        self.assertGreater(stats['plies'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
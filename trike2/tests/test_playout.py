@@ -0,0 +1,115 @@
+import random
+import unittest
+from src.bitboard import BitBoard
+from src.board import Board
+from src.checker import Checker
+from src.engine import GameEngine
+from src.game import Game
+from src.playout import PlayoutKernel, get_kernel
+
+class TestPlayoutKernel(unittest.TestCase):
+
+    def replay(self, game, kernel):
+        # Apply the kernel's moves to a clone with the regular engine
+        replay = game.clone()
+        for i in kernel.played:
+            self.assertIn(kernel.layout.coords[i], replay.legal_moves())
+            replay.play(kernel.layout.coords[i])
+        return replay
+
+    def test_playout_matches_engine(self):
+        rng = random.Random(3)
+        for board_class in (Board, BitBoard):
+            for opening in ([], [(2, 2)], [(2, 2), (2, 0), (4, 0)]):
+                game = Game(7, board_class)
+                for move in opening:
+                    game.play(move)
+                key = game.key()
+                kernel = PlayoutKernel(7)
+                result = kernel.run(game, rng)
+                self.assertEqual(game.key(), key)
+                replay = self.replay(game, kernel)
+                self.assertTrue(replay.is_terminal())
+                self.assertEqual(result, replay.scores())
+
+    def test_scores_follow_swapped_players(self):
+        game = Game(7)
+        game.play((3, 1))
+        game.swap()
+        kernel = get_kernel(7)
+        result = game.random_playout(random.Random(5))
+        self.assertEqual(result, self.replay(game, kernel).scores())
+
+    def test_generic_playout_restores_state(self):
+        game = Game(7)
+        game.play((3, 1))
+        key = game.key()
+        result, finished = GameEngine.truncated_playout(game, random.Random(2))
+        self.assertTrue(finished)
+        self.assertEqual(game.key(), key)
+        self.assertEqual(game.ply(), 1)
+        self.assertEqual(len(result), 2)
+
+    def test_cutoffs(self):
+        game = Game(13)
+        game.play((6, 3))
+        kernel = get_kernel(13)
+        moves = []
+        result, finished = game.truncated_playout(random.Random(1), moves, max_plies=5)
+        self.assertFalse(finished)
+        self.assertEqual(len(moves), 5)
+        self.assertEqual(result, self.replay(game, kernel).cutoff_scores())
+        # The generic playout scores cutoffs the same way
+        moves = []
+        result, finished = GameEngine.truncated_playout(game, random.Random(1), moves, max_plies=5)
+        self.assertFalse(finished)
+        replay = game.clone()
+        for move in moves:
+            replay.play(move)
+        self.assertEqual(result, replay.cutoff_scores())
+        # Stopping on a small region leaves a pawn with few empty cells around
+        result, finished = game.truncated_playout(random.Random(1), region_limit=6)
+        replay = self.replay(game, kernel)
+        if not finished:
+            self.assertLessEqual(len(replay.legal_moves()), 6)
+            self.assertEqual(result, replay.cutoff_scores())
+        else:
+            self.assertEqual(result, replay.scores())
+
+    def test_cutoff_scores_skip_last_moves(self):
+        game = Game(7)
+        for move in [(3, 1), (3, 2), (4, 1)]:
+            game.play(move)
+        # The pawn's own cell and the one it just left are not counted,
+        # only (3, 1), which belongs to the player who moved last
+        self.assertEqual(game.scores(), (2, 1))
+        self.assertEqual(game.cutoff_scores(), (1, 0))
+
+    def test_cutoff_without_move_stack(self):
+        # A position set up directly on the board has no previous cell
+        game = Game(7)
+        game.board.place_checker(3, 2, Checker('white'))
+        game.board.place_checker(3, 3, Checker('black'))
+        game.board.pawn_position = (3, 3)
+        self.assertEqual(game.cutoff_scores(), (1, 0))
+        result, finished = game.truncated_playout(random.Random(1), max_plies=0)
+        self.assertFalse(finished)
+        self.assertEqual(result, (1, 0))
+
+    def test_bitboard_cells(self):
+        board, bitboard = Board(7), BitBoard(7)
+        for pos, color in [((0, 0), 'black'), ((3, 2), 'white'), ((6, 0), 'white')]:
+            board.place_checker(*pos, Checker(color))
+            bitboard.place_checker(*pos, Checker(color))
+        self.assertEqual(bitboard.cells, board.cells)
+        # The array is kept in step with the bitmasks, and copies own theirs
+        copy = bitboard.copy()
+        board.remove_checker(3, 2)
+        bitboard.remove_checker(3, 2)
+        self.assertEqual(bitboard.cells, board.cells)
+        self.assertNotEqual(copy.cells, bitboard.cells)
+        bitboard.reset()
+        self.assertEqual(bitboard.cells, Board(7).cells)
+
+if __name__ == '__main__':
+    unittest.main()
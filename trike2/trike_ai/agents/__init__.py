@@ -2,6 +2,10 @@ from trike_ai.agents.ai_base import AIBase
 from trike_ai.agents.random_ai import RandomAI
 from trike_ai.agents.minimax_ai import MinimaxAI
 from trike_ai.agents.mcts_ai import MCTSAI
+from trike_ai.agents.opening_stats import OpeningStats
+from trike_ai.agents.compact_mcts import CompactMCTSAI
+from trike_ai.agents.parallel_mcts import RootParallelMCTSAI, TreeParallelMCTSAI
 
 # Export all agents
-__all__ = ['AIBase', 'RandomAI', 'MinimaxAI', 'MCTSAI']
\ No newline at end of file
+__all__ = ['AIBase', 'RandomAI', 'MinimaxAI', 'MCTSAI', 'RootParallelMCTSAI',
+           'TreeParallelMCTSAI', 'CompactMCTSAI', 'OpeningStats']
\ No newline at end of file
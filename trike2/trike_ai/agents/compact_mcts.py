@@ -0,0 +1,183 @@
+import math
+import random
+import time
+from array import array
+from trike_ai.agents.mcts_ai import MCTSAI
+
+
+class CompactTree:
+    """
+    MCTS tree stored as parallel arrays indexed by node number.
+
+    Node 0 is the root. The children of a node are created together when it
+    is expanded and occupy the contiguous range
+    first_child[n] .. first_child[n] + num_children[n]. Moves are stored as
+    q * size + r. No game state is kept per node.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.parent = array('i', [-1])
+        self.move = array('i', [-1])
+        # Index of the player who made the move into the node
+        self.mover = array('b', [-1])
+        self.visits = array('i', [0])
+        self.wins = array('d', [0.0])
+        self.first_child = array('i', [-1])
+        self.num_children = array('i', [0])
+
+    def __len__(self):
+        return len(self.parent)
+
+    def expand(self, node, moves, mover):
+        """Append one child per (q, r) move below an unexpanded node."""
+        self.first_child[node] = len(self.parent)
+        self.num_children[node] = len(moves)
+        size = self.size
+        for q, r in moves:
+            self.parent.append(node)
+            self.move.append(q * size + r)
+            self.mover.append(mover)
+            self.visits.append(0)
+            self.wins.append(0.0)
+            self.first_child.append(-1)
+            self.num_children.append(0)
+
+    def children(self, node):
+        first = self.first_child[node]
+        return range(first, first + self.num_children[node])
+
+    def decode(self, node):
+        """Return the (q, r) move that leads into a node."""
+        return divmod(self.move[node], self.size)
+
+
+class CompactMCTSAI(MCTSAI):
+    """
+    MCTS agent that keeps its tree in a CompactTree.
+
+    Instead of a game state per node, the search holds one clone of the
+    root position and replays the selected path onto it every iteration,
+    taking the moves back with undo() afterwards. Memory per node is a few
+    array slots, so searches of 100k+ iterations stay small and create no
+    objects for the garbage collector to scan.
+    """
+
+    def __init__(self, iterations=1000, name="Compact MCTS AI", time_limit_ms=None,
+                 exploration_weight=1.41):
+        """
+        Initialize the compact MCTS agent.
+
+        Args:
+            iterations (int): Number of MCTS iterations to run
+            name (str): Name of the AI agent
+            time_limit_ms (float): If set, search until this many milliseconds
+                have passed instead of for a fixed number of iterations
+            exploration_weight (float): Weight for exploration term in UCT
+        """
+        super().__init__(iterations=iterations, name=name, time_limit_ms=time_limit_ms)
+        self.exploration_weight = exploration_weight
+        self.tree = None
+        self.state = None
+
+    def choose_move(self, game_state):
+        """
+        Choose the best move using MCTS on the compact tree.
+
+        Args:
+            game_state: Current game state (a src.engine.GameEngine)
+
+        Returns:
+            tuple: (q, r) coordinates of the best move
+        """
+        valid_moves = game_state.legal_moves()
+        if not valid_moves:
+            return None
+        if game_state.ply() == 0:
+            return self._opening_move(valid_moves)
+
+        tree = self.search(game_state)
+        children = tree.children(0)
+        if not children:
+            return random.choice(valid_moves)
+        return tree.decode(max(children, key=tree.visits.__getitem__))
+
+    def search(self, game_state):
+        """
+        Run the configured search budget from the given position.
+
+        Args:
+            game_state: Current game state (left untouched)
+
+        Returns:
+            CompactTree: The searched tree, also kept as self.tree
+        """
+        self.state = game_state.clone()
+        self.tree = CompactTree(game_state.size)
+        moves = self.state.unique_moves(self.state.legal_moves())
+        random.shuffle(moves)
+        self.tree.expand(0, moves, self.state.to_move())
+        self.search_stats = {}
+
+        start = time.perf_counter()
+        self.search_stats["iterations"] = self._run(0, start)
+        self.search_stats["elapsed_ms"] = (time.perf_counter() - start) * 1000
+        self.search_stats["nodes"] = len(self.tree)
+        return self.tree
+
+    def _iterate(self, root):
+        tree, state = self.tree, self.state
+        visits, wins = tree.visits, tree.wins
+        first_child, num_children = tree.first_child, tree.num_children
+        weight = self.exploration_weight
+        node = root
+        depth = 0
+
+        # Selection: follow UCT through expanded nodes, replaying the moves;
+        # unvisited children were shuffled at expansion, so taking the first
+        # one is a random choice among them
+        while num_children[node]:
+            first = first_child[node]
+            log_parent_visits = math.log(visits[node]) if visits[node] else 0.0
+            best, best_score = first, -1.0
+            for child in range(first, first + num_children[node]):
+                child_visits = visits[child]
+                if not child_visits:
+                    best = child
+                    break
+                score = wins[child] / child_visits + weight * math.sqrt(log_parent_visits / child_visits)
+                if score > best_score:
+                    best, best_score = child, score
+            node = best
+            state.play(tree.decode(node))
+            depth += 1
+
+        # Expansion: a leaf that has been visited before gets all its children
+        if visits[node] and not state.is_terminal():
+            moves = state.legal_moves()
+            random.shuffle(moves)
+            tree.expand(node, moves, state.to_move())
+            node = first_child[node]
+            state.play(tree.decode(node))
+            depth += 1
+
+        # Simulation
+        value = self._rollout(state)
+
+        # Backpropagation along the parent links, crediting each node's mover
+        mover = tree.mover
+        parent = tree.parent
+        while node >= 0:
+            visits[node] += 1
+            if node:
+                wins[node] += value if mover[node] == 0 else 1 - value
+            node = parent[node]
+
+        for _ in range(depth):
+            state.undo()
+
+    def reset(self):
+        """Drop the tree and state of the last search."""
+        super().reset()
+        self.tree = None
+        self.state = None
@@ -1,9 +1,40 @@
-import copy
 import random
 import math
-from collections import defaultdict
+import time
+from array import array
 from trike_ai.agents.ai_base import AIBase
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only vectorised selection needs it
+    np = None
+
+
+def outcome(scores):
+    """Return player 0's result for (player1_score, player2_score): 1, 0.5 for a tie, or 0."""
+    if scores[0] > scores[1]:
+        return 1.0
+    if scores[0] == scores[1]:
+        return 0.5
+    return 0.0
+
+
+def rollout_value(game_state, rng=random, moves=None, max_plies=None, region_limit=None,
+                  cutoff_scale=1.0):
+    """
+    Play a random rollout and return player 0's expected result in [0, 1].
+    
+    A rollout that reaches the end scores its outcome(). One stopped early by
+    `max_plies` or `region_limit` is scored statically instead: the
+    difference of the engine's cutoff_scores(), the checkers around the
+    pawn without the two placed by the last moves, is mapped to a win
+    probability with a logistic curve of width `cutoff_scale`.
+    """
+    scores, finished = game_state.truncated_playout(rng, moves, max_plies, region_limit)
+    if finished:
+        return outcome(scores)
+    return 1 / (1 + math.exp((scores[1] - scores[0]) / cutoff_scale))
+
 # Monte Carlo Tree Search (MCTS) Node
 class MCTSNode:
     """Node for Monte Carlo Tree Search."""
@@ -15,26 +46,33 @@ class MCTSNode:
         self.children = []
         self.visits = 0
         self.wins = 0
-        self.untried_moves = self._get_valid_moves(game_state)
-        self.player = game_state.current_player_index
-    
-    def _get_valid_moves(self, game_state):
-        """Get valid moves for the current state."""
-        # If this is the first move (pawn not placed yet)
-        if game_state.pawn.position is None:
-            # All empty cells are valid for the first move
-            return [(q, r) for (q, r) in game_state.board.grid 
-                   if game_state.board.grid[(q, r)] is None]
-        
-        # Otherwise, get valid moves from current pawn position
-        valid_moves = []
-        q_from, r_from = game_state.pawn.position
-        
-        for (q, r) in game_state.board.grid:
-            if game_state.board.is_valid_move(q_from, r_from, q, r):
-                valid_moves.append((q, r))
-                
-        return valid_moves
+        # Rollouts in flight through this node, counted as losses by
+        # select_child so parallel searches spread over different paths
+        self.virtual_loss = 0
+        # Visits per child move through this node, kept only when nodes are
+        # shared between parents (see MCTSAI's transpositions option)
+        self.edge_visits = None
+        # All-moves-as-first statistics of the player to move here, as
+        # {move: [visits, wins]}, kept only when MCTSAI uses RAVE
+        self.amaf = None
+        # Exact result for the player who moved into this node (1, 0.5 or
+        # 0) once MCTS-Solver has proven it, otherwise None
+        self.proven = None
+        # Contiguous copies of the children's visits and wins, with NumPy
+        # views, once MCTSAI's vectorised selection has set them up
+        self.child_visits = None
+        self.child_wins = None
+        # -inf for proven children, so vectorised selection skips them
+        self.child_closed = None
+        self._visits_view = None
+        self._wins_view = None
+        self._closed_view = None
+        self.slot = None  # Index of this node in its parent's buffers
+        # (visits, wins) already accounted for in MCTSAI's opening
+        # statistics, seeded or recorded, so they are not recorded again
+        self.stored = None
+        self.untried_moves = game_state.legal_moves()
+        self.player = game_state.to_move()  # Player to move in this state
     
     def is_fully_expanded(self):
         """Check if all possible child nodes have been created."""
@@ -42,28 +80,88 @@ class MCTSNode:
     
     def is_terminal(self):
         """Check if this node represents a terminal state (game over)."""
-        return (self.game_state.pawn.position is not None and 
-                self.game_state.board.is_pawn_trapped())
+        return self.game_state.is_terminal()
     
-    def select_child(self, exploration_weight=1.41):
+    def select_child(self, exploration_weight=1.41, rave_equivalence=None, skip_proven=False):
         """
         Select a child node using UCT formula.
         
         Args:
             exploration_weight (float): Weight for exploration term in UCT
+            rave_equivalence (float): If set, blend the AMAF value of each
+                move into its win rate with weight
+                sqrt(k / (3 * visits + k)), so RAVE dominates while a child
+                has few visits and fades out as they grow past k
+            skip_proven (bool): Leave out children whose result is proven,
+                as searching them further cannot change it
         
         Returns:
             MCTSNode: Selected child node
         """
         # UCT = wins/visits + exploration_weight * sqrt(ln(parent_visits)/visits)
-        log_parent_visits = math.log(self.visits)
+        # with pending rollouts counted as visits that were lost
+        log_parent_visits = math.log(self.visits + self.virtual_loss)
+        edge_visits = self.edge_visits
+        amaf = self.amaf if rave_equivalence else None
         
         def uct_score(child):
-            exploitation = child.wins / child.visits if child.visits > 0 else 0
-            exploration = exploration_weight * math.sqrt(log_parent_visits / child.visits) if child.visits > 0 else float('inf')
+            visits = child.visits + child.virtual_loss
+            # In a DAG the child's value is shared by all its parents, but
+            # exploration is driven by how often this edge was taken
+            tries = visits if edge_visits is None else edge_visits.get(child.move, 0) + child.virtual_loss
+            exploitation = child.wins / visits if visits > 0 else 0
+            if amaf is not None and child.move in amaf:
+                amaf_visits, amaf_wins = amaf[child.move]
+                beta = math.sqrt(rave_equivalence / (3 * visits + rave_equivalence))
+                exploitation = (1 - beta) * exploitation + beta * amaf_wins / amaf_visits
+            exploration = exploration_weight * math.sqrt(log_parent_visits / tries) if tries > 0 else float('inf')
             return exploitation + exploration
-            
-        return max(self.children, key=uct_score)
+        
+        children = self.children
+        if skip_proven:
+            children = [child for child in children if child.proven is None] or children
+        return max(children, key=uct_score)
+    
+    def init_child_buffers(self):
+        """
+        Copy the children's statistics into contiguous buffers.
+        
+        The buffers are array('d') objects, so backpropagation can update
+        single slots cheaply, and NumPy views of them let
+        select_child_vectorized score all children at once. The set of
+        children must be final, i.e. the node fully expanded.
+        """
+        self.child_visits = array('d', (child.visits for child in self.children))
+        self.child_wins = array('d', (child.wins for child in self.children))
+        self.child_closed = array('d', (0.0 if child.proven is None else -math.inf
+                                        for child in self.children))
+        self._visits_view = np.frombuffer(self.child_visits)
+        self._wins_view = np.frombuffer(self.child_wins)
+        self._closed_view = np.frombuffer(self.child_closed)
+        for slot, child in enumerate(self.children):
+            child.slot = slot
+    
+    def select_child_vectorized(self, exploration_weight=1.41, skip_proven=False):
+        """
+        Select a child with the UCT formula evaluated over all children at once.
+        
+        Args:
+            exploration_weight (float): Weight for exploration term in UCT
+            skip_proven (bool): Leave out children whose result is proven
+        
+        Returns:
+            MCTSNode: Selected child node
+        """
+        visits = self._visits_view
+        if not visits.all():
+            # Unvisited children score infinity; take the first, as max() does
+            return self.children[int(visits.argmin())]
+        scores = self._wins_view / visits + exploration_weight * np.sqrt(math.log(self.visits) / visits)
+        if skip_proven and self._closed_view.min() < 0:
+            open_scores = scores + self._closed_view
+            if open_scores.max() > -math.inf:
+                scores = open_scores
+        return self.children[int(scores.argmax())]
 
 
 class MCTSAI(AIBase):
@@ -71,203 +169,555 @@ class MCTSAI(AIBase):
     AI agent using Monte Carlo Tree Search.
     """
     
-    def __init__(self, iterations=1000, name="MCTS AI"):
+    # Below this many children the per-child loop is faster than NumPy
+    vector_min_children = 24
+    # Iterations between checks of the early_stop condition
+    early_stop_interval = 16
+    
+    def __init__(self, iterations=1000, name="MCTS AI", time_limit_ms=None, transpositions=False,
+                 rave=False, rave_equivalence=10, rollout_plies=None, rollout_region=None,
+                 cutoff_scale=1.0, solver=False, vectorized=False, early_stop=False,
+                 opening_stats=None):
         """
         Initialize the MCTS AI agent.
         
         Args:
             iterations (int): Number of MCTS iterations to run
             name (str): Name of the AI agent
+            time_limit_ms (float): If set, search until this many milliseconds
+                have passed instead of for a fixed number of iterations
+            transpositions (bool): Share one node between all move orders
+                reaching the same position, turning the tree into a DAG
+            rave (bool): Keep RAVE (all-moves-as-first) statistics from the
+                moves of every rollout and blend them into selection
+            rave_equivalence (float): Visit count at which a child's own
+                statistics and its RAVE value get equal weight
+            rollout_plies (int): Stop rollouts after this many moves and
+                score them with a static evaluation
+            rollout_region (int): Stop rollouts once the empty region around
+                the pawn has at most this many cells
+            cutoff_scale (float): Checker difference that moves the win
+                probability of a stopped rollout from 0.5 to about 0.73
+            solver (bool): Prove results from terminal positions upwards
+                (MCTS-Solver), skip proven subtrees and stop as soon as the
+                root is proven
+            vectorized (bool): Score the children of nodes with at least
+                `vector_min_children` children in one NumPy expression
+                (requires numpy; not combined with RAVE or transpositions,
+                which keep the per-child formula)
+            early_stop (bool): End the search once the most visited root
+                move cannot be overtaken in the remaining budget; with a
+                time limit the remaining iterations are estimated from the
+                rate so far
+            opening_stats (OpeningStats): Store of opening statistics kept
+                across games; new nodes within its plies start with the
+                stored visits and wins, and every search adds its own
         """
         self.iterations = iterations
         self.name = name
+        self.time_limit_ms = time_limit_ms
+        self.transpositions = transpositions
+        self.rave = rave
+        self.rave_equivalence = rave_equivalence
+        self.rollout_plies = rollout_plies
+        self.rollout_region = rollout_region
+        self.cutoff_scale = cutoff_scale
+        self.solver = solver
+        if vectorized and np is None:
+            raise ImportError("vectorized selection requires numpy")
+        self.vectorized = vectorized and not rave and not transpositions
+        self.early_stop = early_stop
+        self.opening_stats = opening_stats
+        # Search tree kept between moves so later searches can reuse it
+        self.root = None
+        # Nodes by position key when transpositions are enabled
+        self.table = {}
+        # Statistics of the last search
+        self.search_stats = {}
     
     def choose_move(self, game_state):
         """
         Choose the best move using MCTS algorithm.
         
         Args:
-            game_state: Current state of the game
+            game_state: Current game state (a src.engine.GameEngine)
             
         Returns:
             tuple: (q, r) coordinates of the best move
         """
         # Check if there are valid moves
-        valid_moves = self._get_valid_moves(game_state)
+        valid_moves = game_state.legal_moves()
         if not valid_moves:
             return None
         
         # First move optimization - choose center or near-center
-        if game_state.pawn.position is None:
-            board_size = len(game_state.board.grid) ** 0.5 // 2  # Approximate
-            center_q, center_r = int(board_size), int(board_size)
-            
-            # Try to get a position close to center
-            for q, r in sorted(valid_moves, 
-                              key=lambda pos: abs(pos[0]-center_q) + abs(pos[1]-center_r)):
-                if (q, r) in valid_moves:
-                    return (q, r)
-        
-        # Full MCTS for other moves
-        root = MCTSNode(copy.deepcopy(game_state))
-        
-        # Run MCTS iterations
-        for _ in range(self.iterations):
-            # 1. Selection
-            node = root
-            while not node.is_terminal() and node.is_fully_expanded():
-                node = node.select_child()
-            
-            # 2. Expansion
-            if not node.is_terminal() and not node.is_fully_expanded():
-                move = random.choice(node.untried_moves)
-                node.untried_moves.remove(move)
-                child_state = self._simulate_move(node.game_state, move)
-                node.children.append(MCTSNode(child_state, parent=node, move=move))
-                node = node.children[-1]
-            
-            # 3. Simulation
-            result = self._rollout(node.game_state)
-            
-            # 4. Backpropagation
-            while node:
-                node.visits += 1
-                # Update wins if result is favorable for the player at this node
-                current_player = node.player
-                opponent = (current_player + 1) % 2
-                
-                if result[current_player] > result[opponent]:
-                    node.wins += 1
-                elif result[current_player] == result[opponent]:
-                    node.wins += 0.5  # Tie counts as half-win
-                
-                node = node.parent
+        if game_state.ply() == 0:
+            return self._opening_move(valid_moves)
+        
+        root = self.search(game_state)
         
         # Choose child with most visits
         if root.children:
-            best_child = max(root.children, key=lambda c: c.visits)
-            return best_child.move
+            return self._best_child(root).move
         else:
             # Fallback to random move if MCTS didn't explore any moves
             return random.choice(valid_moves)
     
-    def _simulate_move(self, game_state, move):
+    def _best_child(self, root):
         """
-        Simulate a move on a copy of the game state.
+        Pick the root child to play: the most visited one, unless the solver
+        has proven a win or ruled out children as losses.
         
         Args:
-            game_state: Current game state
-            move: (q, r) coordinates for the move
+            root: Root node of the search
             
         Returns:
-            New game state after the move
+            MCTSNode: Child to play
+        """
+        children = root.children
+        if self.solver:
+            proven_wins = [child for child in children if child.proven == 1]
+            if proven_wins:
+                return max(proven_wins, key=lambda c: c.visits)
+            if root.proven is not None:
+                return max(children, key=lambda c: (c.proven, c.visits))
+            children = [child for child in children if child.proven != 0] or children
+        return max(children, key=lambda c: c.visits)
+    
+    def search(self, game_state):
         """
-        # Create a deep copy of the game state
-        new_state = copy.deepcopy(game_state)
+        Run the configured search budget from the given position.
         
-        # Apply the move
-        q, r = move
-        current_player = new_state.players[new_state.current_player_index]
+        Args:
+            game_state: Current game state (left untouched)
+            
+        Returns:
+            MCTSNode: Root of the searched tree, also kept as self.root
+        """
+        # Full MCTS for other moves, continuing from the previous tree when
+        # it already contains this position
+        root = self._find_subtree(game_state)
+        if root is None:
+            root = self._make_node(game_state.clone())
+            root.untried_moves = game_state.unique_moves(root.untried_moves)
+        root.parent = None
+        self.root = root
+        self.search_stats = {"reused_visits": root.visits}
+        if self.transpositions:
+            # Only positions below the new root can still be reached
+            self.table = self._reachable_table(root)
         
-        # If this is first move, place pawn
-        if new_state.pawn.position is None:
-            new_state.board.place_checker(q, r, current_player)
-            new_state.pawn.position = (q, r)
-            new_state.board.pawn_position = (q, r)
-        else:
-            # Regular move - place checker and move pawn
-            new_state.board.place_checker(q, r, current_player)
-            new_state.pawn.position = (q, r)
-            new_state.board.pawn_position = (q, r)
+        # Run MCTS iterations until the budget is spent
+        start = time.perf_counter()
+        self.search_stats["iterations"] = self._run(root, start)
+        self.search_stats["elapsed_ms"] = (time.perf_counter() - start) * 1000
+        if self.solver:
+            self.search_stats["proven"] = root.proven
+        if self.opening_stats is not None:
+            if game_state.ply() < self.opening_stats.max_plies:
+                self._record_opening(root)
+            else:
+                # Out of the opening: write this game's statistics
+                self.opening_stats.flush()
         
-        # Swap player
-        new_state.current_player_index = (new_state.current_player_index + 1) % 2
+        return root
+    
+    def _opening_move(self, valid_moves):
+        """
+        Pick the cell closest to the centre for the first move of the game.
         
-        return new_state
+        Args:
+            valid_moves: Legal moves, i.e. every cell of the empty board
+            
+        Returns:
+            tuple: (q, r) coordinates of the move
+        """
+        # Every cell is legal on the first move
+        board_size = len(valid_moves) ** 0.5 // 2  # Approximate
+        center_q, center_r = int(board_size), int(board_size)
+        
+        # Try to get a position close to center
+        for q, r in sorted(valid_moves, 
+                          key=lambda pos: abs(pos[0]-center_q) + abs(pos[1]-center_r)):
+            if (q, r) in valid_moves:
+                return (q, r)
     
-    def _rollout(self, game_state):
+    def _run(self, root, start):
         """
-        Simulate a random playout from the current state until game end.
+        Run iterations from the root until the search budget is spent.
         
         Args:
-            game_state: Current game state
+            root: Root node of the search
+            start: perf_counter() time the search started at
             
         Returns:
-            tuple: (player1_score, player2_score) at the end of the game
-        """
-        state = copy.deepcopy(game_state)
-        
-        # Play until the game ends
-        while state.pawn.position is None or not state.board.is_pawn_trapped():
-            valid_moves = self._get_valid_moves(state)
-            if not valid_moves:
-                break
-                
-            # Choose a random move
-            move = random.choice(valid_moves)
+            int: Number of iterations completed
+        """
+        solver = self.solver
+        early_stop = self.early_stop
+        interval = self.early_stop_interval
+        if early_stop:
+            self.search_stats["saved_iterations"] = 0
+        if self.time_limit_ms is None:
+            for iterations in range(self.iterations):
+                if solver and root.proven is not None:
+                    # Solved: more iterations cannot change the result
+                    return iterations
+                remaining = self.iterations - iterations
+                if early_stop and iterations % interval == 0 and self._unassailable(root, remaining):
+                    self.search_stats["saved_iterations"] = remaining
+                    return iterations
+                self._iterate(root)
+            return self.iterations
+        
+        # Anytime search: always finish at least one iteration, then
+        # stop at the deadline with the best move found so far
+        deadline = start + self.time_limit_ms / 1000
+        iterations = 0
+        if early_stop:
+            self.search_stats["saved_ms"] = 0.0
+        while not (solver and root.proven is not None):
+            if iterations:
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                if early_stop and iterations % interval == 0:
+                    # Iterations still to come at the rate so far
+                    remaining = int(iterations * (deadline - now) / (now - start))
+                    if self._unassailable(root, remaining):
+                        self.search_stats["saved_iterations"] = remaining
+                        self.search_stats["saved_ms"] = (deadline - now) * 1000
+                        break
+            self._iterate(root)
+            iterations += 1
+        return iterations
+    
+    def _unassailable(self, root, remaining):
+        """
+        Check whether the most visited root child keeps the lead whatever
+        the remaining iterations do.
+        
+        Args:
+            root: Root node of the search
+            remaining (int): Iterations left in the budget
             
-            # Apply the move
-            q, r = move
-            current_player = state.players[state.current_player_index]
+        Returns:
+            bool: True if even `remaining` more visits to the runner-up
+                  (or an untried move) would leave it behind the leader
+        """
+        first = second = 0
+        for child in root.children:
+            if child.proven == 0:
+                # Proven losses are never played, however many visits they have
+                continue
+            visits = child.visits
+            if visits > first:
+                first, second = visits, first
+            elif visits > second:
+                second = visits
+        return first - second > remaining
+    
+    def _iterate(self, root):
+        """
+        Run one selection, expansion, simulation and backpropagation pass.
+        
+        Args:
+            root: Root node of the search
+        """
+        path = self._select_and_expand(root)
+        
+        # 3. Simulation
+        moves = [] if self.rave else None
+        value = self._rollout(path[-1].game_state, moves)
+        
+        # 4. Backpropagation
+        self._backpropagate(path, value)
+        if self.rave:
+            self._update_amaf(path, moves, value)
+    
+    def _select_and_expand(self, root):
+        """
+        Descend the tree with UCT and expand one untried move, if any.
+        
+        Args:
+            root: Root node of the search
             
-            # If this is first move, place pawn
-            if state.pawn.position is None:
-                state.board.place_checker(q, r, current_player)
-                state.pawn.position = (q, r)
-                state.board.pawn_position = (q, r)
+        Returns:
+            list: Nodes from the root down to the node to run the rollout from
+        """
+        # 1. Selection
+        node = root
+        path = [node]
+        rave_equivalence = self.rave_equivalence if self.rave else None
+        while not node.is_terminal() and node.is_fully_expanded():
+            if self.vectorized and len(node.children) >= self.vector_min_children:
+                if node.child_visits is None:
+                    node.init_child_buffers()
+                node = node.select_child_vectorized(skip_proven=self.solver)
             else:
-                # Regular move - place checker and move pawn
-                state.board.place_checker(q, r, current_player)
-                state.pawn.position = (q, r)
-                state.board.pawn_position = (q, r)
-            
-            # Swap player
-            state.current_player_index = (state.current_player_index + 1) % 2
-        
-        # Evaluate the final state
-        pawn_pos = state.pawn.position
-        if pawn_pos:
-            neighbors = state.board.get_neighbors(*pawn_pos)
-            under = state.board.grid[pawn_pos]
+                node = node.select_child(rave_equivalence=rave_equivalence, skip_proven=self.solver)
+            path.append(node)
+        
+        # 2. Expansion
+        if not node.is_terminal() and not node.is_fully_expanded():
+            move = random.choice(node.untried_moves)
+            node.untried_moves.remove(move)
+            child_state = self._simulate_move(node.game_state, move)
+            child = self._make_node(child_state, parent=node, move=move)
+            node.children.append(child)
+            path.append(child)
+        
+        return path
+    
+    def _make_node(self, game_state, parent=None, move=None):
+        """
+        Create the node for a position, or find it in the transposition table.
+        
+        Args:
+            game_state: Position of the node
+            parent: Node the position was reached from
+            move: Move played from the parent
             
-            adj = [state.board.grid.get(n) for n in neighbors]
+        Returns:
+            MCTSNode: New or shared node for the position
+        """
+        if not self.transpositions:
+            return self._seed(MCTSNode(game_state, parent=parent, move=move))
+        # The pawn stands on the last move's cell, so every parent reaches a
+        # shared node with the same move and edges can be keyed by move
+        key = game_state.key()
+        node = self.table.get(key)
+        if node is None:
+            node = MCTSNode(game_state, parent=parent, move=move)
+            node.edge_visits = {}
+            self._seed(node)
+            self.table[key] = node
+        return node
+    
+    def _reachable_table(self, root):
+        """
+        Build a transposition table of the nodes reachable from a root.
+        
+        Args:
+            root: Root node of the search
             
-            black_score = sum(1 for c in adj + [under] if c and c.color == "black")
-            white_score = sum(1 for c in adj + [under] if c and c.color == "white")
+        Returns:
+            dict: Nodes by position key, the root included
+        """
+        table = {root.game_state.key(): root}
+        level = [root]
+        while level:
+            next_level = []
+            for node in level:
+                for child in node.children:
+                    key = child.game_state.key()
+                    if key not in table:
+                        table[key] = child
+                        next_level.append(child)
+            level = next_level
+        return table
+    
+    def _seed(self, node):
+        """
+        Start a new node from its stored opening statistics, if any.
+        
+        Args:
+            node: Node just created
             
-            # Return scores for each player
-            player1 = state.players[0]
-            player2 = state.players[1]
+        Returns:
+            MCTSNode: The node
+        """
+        stats = self.opening_stats
+        if stats is not None and stats.covers(node.game_state):
+            prior = stats.lookup(node.game_state)
+            if prior is not None:
+                node.visits, node.wins = prior
+                node.stored = prior
+        return node
+    
+    def _record_opening(self, root):
+        """
+        Record the statistics the search added to the opening positions of
+        the tree in the opening store.
+        
+        Args:
+            root: Root node of the search
+        """
+        stats = self.opening_stats
+        level = [root]
+        seen = set()
+        while level:
+            next_level = []
+            for node in level:
+                # Shared nodes of a DAG are reached more than once
+                if id(node) in seen or node.game_state.ply() > stats.max_plies:
+                    continue
+                seen.add(id(node))
+                if stats.covers(node.game_state) and node.visits >= stats.min_visits:
+                    visits, wins = node.stored or (0, 0)
+                    if node.visits > visits:
+                        stats.record(node.game_state, node.visits - visits, node.wins - wins)
+                        node.stored = (node.visits, node.wins)
+                next_level.extend(node.children)
+            level = next_level
+    
+    def _backpropagate(self, path, value):
+        """
+        Add a rollout result to the statistics of the nodes along a path.
+        
+        Args:
+            path: Nodes from the root down to the node the rollout started from
+            value: Player 0's result of the rollout, from 0 (loss) to 1 (win)
+        """
+        for node in path:
+            node.visits += 1
+            # Credit the player who made the move into this node, since
+            # that is who the parent chooses for in select_child
+            node.wins += value if node.player == 1 else 1 - value
+        
+        for parent, child in zip(path, path[1:]):
+            if parent.edge_visits is not None:
+                parent.edge_visits[child.move] = parent.edge_visits.get(child.move, 0) + 1
+            if parent.child_visits is not None:
+                parent.child_visits[child.slot] = child.visits
+                parent.child_wins[child.slot] = child.wins
+        
+        if self.solver:
+            self._prove(path)
+    
+    def _prove(self, path):
+        """
+        Back proven results up a path, minimax style.
+        
+        A terminal leaf is proven by its score. A node is then proven when
+        one of its children is a proven win for the player to move there,
+        or when all its moves are expanded and proven, in which case that
+        player takes the best of them.
+        
+        Args:
+            path: Nodes from the root down to the node the rollout started from
+        """
+        leaf = path[-1]
+        if leaf.proven is None:
+            if not leaf.is_terminal():
+                return
+            value = outcome(leaf.game_state.scores())
+            leaf.proven = value if leaf.player == 1 else 1 - value
+        
+        for node, child in zip(reversed(path[:-1]), reversed(path)):
+            if node.child_closed is not None and child.proven is not None:
+                node.child_closed[child.slot] = -math.inf
+            if node.proven is not None:
+                continue
+            # Children's results are from this node's player's perspective
+            results = [child.proven for child in node.children]
+            if 1 in results:
+                node.proven = 0
+            elif node.is_fully_expanded() and None not in results:
+                node.proven = 1 - max(results)
+            else:
+                # Ancestors depend on this node, so nothing more to prove
+                return
+    
+    def _update_amaf(self, path, rollout_moves, value):
+        """
+        Credit every move of an iteration to the AMAF statistics above it.
+        
+        Each node on the path records, for the player to move there, every
+        later move that player made in the tree or the rollout, as if it had
+        been played first. A cell is played at most once per game, so each
+        move is counted once.
+        
+        Args:
+            path: Nodes from the root down to the rollout's start
+            rollout_moves: Moves played in the rollout, in order
+            value: Player 0's result of the rollout, from 0 (loss) to 1 (win)
+        """
+        moves = [node.move for node in path[1:]] + rollout_moves
+        for depth, node in enumerate(path):
+            if node.amaf is None:
+                node.amaf = {}
+            win = value if node.player == 0 else 1 - value
+            amaf = node.amaf
+            # The player to move here makes every second move from now on
+            for move in moves[depth::2]:
+                stats = amaf.get(move)
+                if stats is None:
+                    amaf[move] = [1, win]
+                else:
+                    stats[0] += 1
+                    stats[1] += win
+    
+    def _find_subtree(self, game_state):
+        """
+        Find the node of the kept tree that matches the current position.
+
+        After our move and the opponent's reply the position is normally a
+        grandchild of the previous root; the root itself and its children are
+        checked too, so repeated calls on one position also reuse the tree.
+        
+        Args:
+            game_state: Current game state
             
-            player1_score = black_score if player1.color == "black" else white_score
-            player2_score = white_score if player1.color == "black" else black_score
+        Returns:
+            MCTSNode or None: Matching node with its statistics, if any
+        """
+        if self.root is None:
+            return None
+        key, ply = game_state.key(), game_state.ply()
+        if self.transpositions:
+            node = self.table.get(key)
+            return node if node is not None and node.game_state.ply() == ply else None
+        level = [self.root]
+        for _ in range(3):
+            for node in level:
+                if node.game_state.ply() == ply and node.game_state.key() == key:
+                    return node
+            level = [child for node in level for child in node.children]
+        return None
+    
+    def _simulate_move(self, game_state, move):
+        """
+        Simulate a move on a copy of the game state.
+        
+        Args:
+            game_state: Current game state
+            move: (q, r) coordinates for the move
             
-            return (player1_score, player2_score)
+        Returns:
+            New game state after the move
+        """
+        # Copy the game state and apply the move in place
+        new_state = game_state.clone()
+        new_state.play(move)
         
-        return (0, 0)  # No pawn placed yet (shouldn't happen in a rollout)
+        return new_state
     
-    def _get_valid_moves(self, game_state):
-        """Get valid moves from the game state."""
-        # If this is the first move (pawn not placed yet)
-        if game_state.pawn.position is None:
-            # All empty cells are valid for the first move
-            return [(q, r) for (q, r) in game_state.board.grid 
-                   if game_state.board.grid[(q, r)] is None]
-        
-        # Otherwise, get valid moves from current pawn position
-        valid_moves = []
-        q_from, r_from = game_state.pawn.position
-        
-        for (q, r) in game_state.board.grid:
-            if game_state.board.is_valid_move(q_from, r_from, q, r):
-                valid_moves.append((q, r))
-                
-        return valid_moves
+    def _rollout(self, game_state, moves=None):
+        """
+        Simulate a random playout from the current state until game end
+        or the configured cutoff.
+        
+        Args:
+            game_state: Current game state
+            moves: Optional list that the moves played are appended to
+            
+        Returns:
+            float: Player 0's result, from 0 (loss) through 0.5 (tie) to 1 (win)
+        """
+        # The engine plays the moves out and restores the state itself; Game
+        # does this on a flat scratch buffer without touching the node's state
+        return rollout_value(game_state, random, moves, self.rollout_plies, self.rollout_region,
+                             self.cutoff_scale)
     
     def train(self, training_data):
         """MCTS doesn't require traditional training."""
         pass
     
     def reset(self):
-        """Nothing to reset for basic MCTS."""
-        pass
\ No newline at end of file
+        """Drop the search tree kept from previous moves."""
+        if self.opening_stats is not None:
+            self.opening_stats.flush()
+        self.root = None
+        self.table = {}
+        self.search_stats = {}
@@ -1,39 +1,59 @@
-import copy
+import time
 from trike_ai.agents.ai_base import AIBase
 
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time limit of MinimaxAI runs out."""
+
+
 class MinimaxAI(AIBase):
     """
     AI agent using the Minimax algorithm with alpha-beta pruning.
     """
     
-    def __init__(self, depth=3, name="Minimax AI"):
+    def __init__(self, depth=3, name="Minimax AI", time_limit_ms=None):
         """
         Initialize the Minimax AI agent.
         
         Args:
             depth (int): Maximum depth for the minimax search
             name (str): Name of the AI agent
+            time_limit_ms (float): If set, deepen the search one ply at a
+                time until this many milliseconds have passed, ignoring
+                `depth`, and play the best move of the deepest completed
+                search
         """
         self.depth = depth
         self.name = name
+        self.time_limit_ms = time_limit_ms
+        # Statistics of the last search
+        self.search_stats = {}
+        # Best move found at each position by the previous iteration, by
+        # position key, tried first by the next one
+        self.best_moves = {}
+        self.deadline = None
+        self.nodes = 0
+        self.root_player = None
+        self.cut_off = False
     
     def choose_move(self, game_state):
         """
         Choose the best move using minimax with alpha-beta pruning.
         
         Args:
-            game_state: Current state of the game
+            game_state: Current game state (a src.engine.GameEngine)
             
         Returns:
             tuple: (q, r) coordinates of the best move
         """
-        valid_moves = self._get_valid_moves(game_state)
+        valid_moves = game_state.legal_moves()
         if not valid_moves:
             return None
             
         # First move: choose center or near-center position if possible
-        if game_state.pawn.position is None:
-            board_size = len(game_state.board.grid) ** 0.5 // 2  # Approximate
+        if game_state.ply() == 0:
+            # Every cell is legal on the first move
+            board_size = len(valid_moves) ** 0.5 // 2  # Approximate
             center_q, center_r = int(board_size), int(board_size)
             
             # Try to get a position close to center
@@ -46,17 +66,70 @@ class MinimaxAI(AIBase):
             return valid_moves[0]
             
         # Use minimax for subsequent moves
+        start = time.perf_counter()
+        self.nodes = 0
+        self.best_moves = {}
+        self.root_player = game_state.to_move()
+        moves = game_state.unique_moves(valid_moves)
+        
+        if self.time_limit_ms is None:
+            self.deadline = None
+            best_move, _ = self._search_root(game_state.clone(), moves, self.depth)
+            self.search_stats = {"depth": self.depth, "nodes": self.nodes,
+                                 "elapsed_ms": (time.perf_counter() - start) * 1000}
+            return best_move
+        
+        # Iterative deepening: the first ply is always searched in full, so
+        # there is a move to play, and each deeper search is abandoned at
+        # the deadline in favour of the last completed one
+        depth = 0
+        best_move = None
+        while True:
+            self.deadline = None if depth == 0 else start + self.time_limit_ms / 1000
+            self.cut_off = False
+            try:
+                # The search state is left mid-line on a timeout, so every
+                # iteration gets a fresh copy
+                best_move, scores = self._search_root(game_state.clone(), moves, depth + 1)
+            except _SearchTimeout:
+                break
+            depth += 1
+            if not self.cut_off or time.perf_counter() >= start + self.time_limit_ms / 1000:
+                # The whole game tree was searched, or the time is up
+                break
+            # Search the most promising moves first next time; a good first
+            # move narrows the alpha-beta window for the rest
+            moves = sorted(moves, key=scores.get, reverse=True)
+        self.search_stats = {"depth": depth, "nodes": self.nodes,
+                             "elapsed_ms": (time.perf_counter() - start) * 1000}
+        return best_move
+    
+    def _search_root(self, state, moves, depth):
+        """
+        Search every root move to the given depth.
+        
+        Args:
+            state: Private copy of the position, changed in place
+            moves: Root moves, in the order to search them
+            depth (int): Depth of the search, counting the root move
+            
+        Returns:
+            tuple: (best move, {move: score}); scores of moves that cannot
+                   be best are only upper bounds
+        """
         best_score = float('-inf')
         best_move = None
         alpha = float('-inf')
         beta = float('inf')
+        scores = {}
         
-        for move in valid_moves:
-            # Create a deep copy of the game state to simulate the move
-            next_state = self._simulate_move(game_state, move)
+        for move in moves:
+            state.play(move)
             
             # Get score from minimax algorithm
-            score = self._minimax(next_state, self.depth-1, False, alpha, beta)
+            score = self._minimax(state, depth-1, False, alpha, beta)
+            state.undo()
+            scores[move] = score
             
             if score > best_score:
                 best_score = score
@@ -64,7 +137,7 @@ class MinimaxAI(AIBase):
                 
             alpha = max(alpha, best_score)
             
-        return best_move
+        return best_move, scores
     
     def _minimax(self, game_state, depth, is_maximizing, alpha, beta):
         """
@@ -78,73 +151,57 @@ class MinimaxAI(AIBase):
             beta (float): Beta value for pruning
             
         Returns:
-            float: Evaluation score of the position
+            float: Evaluation score of the position for the player to move
+                   at the root
         """
+        self.nodes += 1
+        if self.deadline is not None and not self.nodes & 255 and time.perf_counter() >= self.deadline:
+            raise _SearchTimeout()
+        
         # Terminal conditions
-        if depth == 0 or self._is_game_over(game_state):
-            return self._evaluate_position(game_state)
-            
-        valid_moves = self._get_valid_moves(game_state)
+        if depth == 0 or game_state.is_terminal():
+            if depth == 0 and not game_state.is_terminal():
+                self.cut_off = True
+            score = self._evaluate_position(game_state)
+            # The evaluation is for the player to move at the leaf
+            return score if game_state.to_move() == self.root_player else -score
+            
+        valid_moves = game_state.legal_moves()
+        key = game_state.key()
+        # Try the previous iteration's best move here first
+        hint = self.best_moves.get(key)
+        if hint is not None and hint in valid_moves:
+            valid_moves.remove(hint)
+            valid_moves.insert(0, hint)
+        best_move = None
         
         if is_maximizing:
             max_eval = float('-inf')
             for move in valid_moves:
-                next_state = self._simulate_move(game_state, move)
-                eval = self._minimax(next_state, depth-1, False, alpha, beta)
-                max_eval = max(max_eval, eval)
+                game_state.play(move)
+                eval = self._minimax(game_state, depth-1, False, alpha, beta)
+                game_state.undo()
+                if eval > max_eval:
+                    max_eval, best_move = eval, move
                 alpha = max(alpha, eval)
                 if beta <= alpha:
                     break  # Beta cutoff
+            self.best_moves[key] = best_move
             return max_eval
         else:
             min_eval = float('inf')
             for move in valid_moves:
-                next_state = self._simulate_move(game_state, move)
-                eval = self._minimax(next_state, depth-1, True, alpha, beta)
-                min_eval = min(min_eval, eval)
+                game_state.play(move)
+                eval = self._minimax(game_state, depth-1, True, alpha, beta)
+                game_state.undo()
+                if eval < min_eval:
+                    min_eval, best_move = eval, move
                 beta = min(beta, eval)
                 if beta <= alpha:
                     break  # Alpha cutoff
+            self.best_moves[key] = best_move
             return min_eval
     
-    def _simulate_move(self, game_state, move):
-        """
-        Simulate a move on a copy of the game state.
-        
-        Args:
-            game_state: Current game state
-            move: (q, r) coordinates for the move
-            
-        Returns:
-            New game state after the move
-        """
-        # Create a deep copy of the game state
-        new_state = copy.deepcopy(game_state)
-        
-        # Apply the move
-        q, r = move
-        current_player = new_state.players[new_state.current_player_index]
-        
-        # If this is first move, place pawn
-        if new_state.pawn.position is None:
-            new_state.board.place_checker(q, r, current_player)
-            new_state.pawn.position = (q, r)
-            new_state.board.pawn_position = (q, r)
-        else:
-            # Regular move - place checker and move pawn
-            new_state.board.place_checker(q, r, current_player)
-            new_state.pawn.position = (q, r)
-            new_state.board.pawn_position = (q, r)
-        
-        # Swap player
-        new_state.current_player_index = (new_state.current_player_index + 1) % 2
-        
-        return new_state
-    
-    def _is_game_over(self, game_state):
-        """Check if the game is over."""
-        return game_state.pawn.position is not None and game_state.board.is_pawn_trapped()
-    
     def _evaluate_position(self, game_state):
         """
         Evaluate the current board position.
@@ -156,72 +213,36 @@ class MinimaxAI(AIBase):
         Returns:
             float: Score of the position
         """
+        player = game_state.to_move()
+        scores = game_state.scores()
+        
         # If game is over, evaluate final position
-        if self._is_game_over(game_state):
-            pawn_pos = game_state.pawn.position
-            neighbors = game_state.board.get_neighbors(*pawn_pos)
-            under = game_state.board.grid[pawn_pos]
-            
-            adj = [game_state.board.grid.get(n) for n in neighbors]
-            
-            current_player = game_state.players[game_state.current_player_index]
-            opponent_index = (game_state.current_player_index + 1) % 2
-            opponent = game_state.players[opponent_index]
-            
-            current_score = sum(1 for c in adj + [under] if c and c.color == current_player.color)
-            opponent_score = sum(1 for c in adj + [under] if c and c.color == opponent.color)
-            
-            return current_score - opponent_score
+        if game_state.is_terminal():
+            return scores[player] - scores[1 - player]
             
         # If game is ongoing, evaluate current position
         # This is a simplistic heuristic - you may want to enhance this
-        pawn_pos = game_state.pawn.position
         
         # If no pawn yet, return neutral score
-        if pawn_pos is None:
+        if game_state.ply() == 0:
             return 0
-            
-        current_player = game_state.players[game_state.current_player_index]
         
         # Count valid moves - more moves is generally better
-        mobility = len(self._get_valid_moves(game_state)) * 0.1
-        
-        # Look at surrounding checkers
-        neighbors = game_state.board.get_neighbors(*pawn_pos)
-        under = game_state.board.grid[pawn_pos]
-        adj = [game_state.board.grid.get(n) for n in neighbors]
+        mobility = len(game_state.legal_moves()) * 0.1
         
-        current_adjacent = sum(1 for c in adj if c and c.color == current_player.color)
-        opponent_adjacent = sum(1 for c in adj if c and c.color != current_player.color)
-        
-        # Prefer positions with your own pieces around the pawn
-        control_score = current_adjacent - opponent_adjacent
+        # Prefer positions with your own pieces around the pawn. scores()
+        # also counts the checker under the pawn, which belongs to the
+        # opponent who just moved, so add it back.
+        control_score = scores[player] - scores[1 - player] + 1
         
         # Combine factors
         return control_score + mobility
     
-    def _get_valid_moves(self, game_state):
-        """Get valid moves from the game state."""
-        # If this is the first move (pawn not placed yet)
-        if game_state.pawn.position is None:
-            # All empty cells are valid for the first move
-            return [(q, r) for (q, r) in game_state.board.grid 
-                   if game_state.board.grid[(q, r)] is None]
-        
-        # Otherwise, get valid moves from current pawn position
-        valid_moves = []
-        q_from, r_from = game_state.pawn.position
-        
-        for (q, r) in game_state.board.grid:
-            if game_state.board.is_valid_move(q_from, r_from, q, r):
-                valid_moves.append((q, r))
-                
-        return valid_moves
-    
     def train(self, training_data):
         """Minimax doesn't use traditional training."""
         pass
     
     def reset(self):
-        """Reset is not needed for basic minimax."""
-        pass
\ No newline at end of file
+        """Drop the statistics and move ordering of the last search."""
+        self.search_stats = {}
+        self.best_moves = {}
\ No newline at end of file
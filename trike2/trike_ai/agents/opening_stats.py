@@ -0,0 +1,130 @@
+import sqlite3
+import threading
+
+
+class OpeningStats:
+    """
+    MCTS statistics of opening positions kept in an sqlite file across games.
+
+    Positions are stored per board size under their canonical key, so all
+    mirror images share one row. For each position the store holds the
+    visits and wins the searches gave it, from the perspective of the
+    player who moved into it, the same convention as MCTSNode.wins. Only
+    the first `max_plies` moves of a game are covered.
+
+    The database is opened on the first lookup. Recorded statistics are
+    kept in memory until flush() adds them to the file, which MCTSAI does
+    once a game has left the opening and when it is reset for a new game.
+    One store can be used from several threads, as the GUI searches each
+    move on a new thread and resets agents from the Tk thread.
+    """
+
+    def __init__(self, path, max_plies=6, min_visits=16, max_prior=200):
+        """
+        Initialize the store.
+
+        Args:
+            path (str): sqlite database file, created if missing
+            max_plies (int): Deepest position, in moves played, to cover
+            min_visits (int): Visits a node needs in one search before it
+                is recorded, so rarely tried lines do not fill the file
+            max_prior (int): Visits a seeded node starts with at most; the
+                stored win rate is kept when the count is scaled down
+        """
+        self.path = path
+        self.max_plies = max_plies
+        self.min_visits = min_visits
+        self.max_prior = max_prior
+        self.connection = None
+        # Serialises use of the connection, cache and pending statistics
+        self.lock = threading.Lock()
+        # Rows read so far by (size, key), None for positions not stored
+        self.cache = {}
+        # Statistics recorded since the last flush, by (size, key)
+        self.pending = {}
+
+    def covers(self, game_state):
+        """Check whether the position is within the opening plies."""
+        return 0 < game_state.ply() <= self.max_plies
+
+    def lookup(self, game_state):
+        """
+        Return the stored (visits, wins) of a position, scaled down to at
+        most max_prior visits, or None if it has none.
+
+        Args:
+            game_state: Position to look up
+        """
+        row_key = self._row_key(game_state)
+        with self.lock:
+            if row_key not in self.cache:
+                self.cache[row_key] = self._connect().execute(
+                    "SELECT visits, wins FROM positions WHERE size = ? AND key = ?", row_key).fetchone()
+            row = self.cache[row_key]
+        if row is None:
+            return None
+        visits, wins = row
+        if visits > self.max_prior:
+            wins = wins * self.max_prior / visits
+            visits = self.max_prior
+        return visits, wins
+
+    def record(self, game_state, visits, wins):
+        """
+        Add search statistics of a position, to be written by flush().
+
+        Args:
+            game_state: Position the statistics belong to
+            visits (int): Visits to add
+            wins (float): Wins to add, for the player who moved into it
+        """
+        row_key = self._row_key(game_state)
+        with self.lock:
+            stats = self.pending.get(row_key)
+            if stats is None:
+                self.pending[row_key] = [visits, wins]
+            else:
+                stats[0] += visits
+                stats[1] += wins
+
+    def flush(self):
+        """Add the recorded statistics to the database."""
+        with self.lock:
+            if not self.pending:
+                return
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT INTO positions (size, key, visits, wins) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (size, key) DO UPDATE SET "
+                    "visits = visits + excluded.visits, wins = wins + excluded.wins",
+                    [(size, key, visits, wins) for (size, key), (visits, wins) in self.pending.items()])
+            # Cached rows of the updated positions are stale now
+            for row_key in self.pending:
+                self.cache.pop(row_key, None)
+            self.pending = {}
+
+    def close(self):
+        """Flush the recorded statistics and close the database."""
+        self.flush()
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def _connect(self):
+        if self.connection is None:
+            # Callers hold self.lock, so the connection may move between threads
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS positions ("
+                "size INTEGER, key INTEGER, visits INTEGER, wins REAL, "
+                "PRIMARY KEY (size, key))")
+        return self.connection
+
+    def _row_key(self, game_state):
+        key = game_state.canonical_key()[0]
+        # sqlite integers are signed 64-bit
+        if key >= 1 << 63:
+            key -= 1 << 64
+        return game_state.size, key
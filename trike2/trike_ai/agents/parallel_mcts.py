@@ -0,0 +1,212 @@
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from trike_ai.agents.mcts_ai import MCTSAI, rollout_value
+
+
+def _search_root(game_state, iterations, time_limit_ms, seed):
+    """
+    Run one independent MCTS search in a worker process.
+
+    Returns:
+        tuple: ({move: (visits, wins)} for the root children, search stats)
+    """
+    random.seed(seed)
+    agent = MCTSAI(iterations=iterations, time_limit_ms=time_limit_ms)
+    root = agent.search(game_state)
+    stats = {child.move: (child.visits, child.wins) for child in root.children}
+    return stats, agent.search_stats
+
+
+def _rollout_leaves(states, seed, max_plies, region_limit, cutoff_scale):
+    """Play out a batch of leaf states in a worker process and return player 0's results."""
+    rng = random.Random(seed)
+    return [rollout_value(state, rng, None, max_plies, region_limit, cutoff_scale) for state in states]
+
+
+class _PooledMCTSAI(MCTSAI):
+    """
+    MCTS agent that hands work to a pool of worker processes.
+
+    The pool is created on the first search and reused for every later
+    move. It is shut down by close(), by reset() between games, or on
+    leaving a `with` block, so callers that never reset the agent should
+    use one of the other two.
+    """
+
+    def __init__(self, iterations, name, time_limit_ms, workers, seed):
+        super().__init__(iterations=iterations, name=name, time_limit_ms=time_limit_ms)
+        self.workers = workers or os.cpu_count() or 1
+        self.rng = random.Random(seed)
+        self.pool = None
+
+    def _get_pool(self):
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self.pool
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def reset(self):
+        """Drop the search tree and shut down the worker pool."""
+        super().reset()
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class RootParallelMCTSAI(_PooledMCTSAI):
+    """
+    MCTS agent that runs independent searches in parallel worker processes.
+
+    Every worker searches the same root position with its own random seed
+    and budget. The visit and win counts of the root children are summed
+    over the workers before the most visited move is chosen.
+    """
+
+    def __init__(self, iterations=1000, name="Root-Parallel MCTS AI", time_limit_ms=None,
+                 workers=None, seed=None):
+        """
+        Initialize the root-parallel MCTS agent.
+
+        Args:
+            iterations (int): Number of MCTS iterations per worker
+            name (str): Name of the AI agent
+            time_limit_ms (float): If set, each worker searches for this long
+                instead of for a fixed number of iterations
+            workers (int): Number of worker processes (defaults to the CPU count)
+            seed (int): Seed for the per-search worker seeds
+        """
+        super().__init__(iterations, name, time_limit_ms, workers, seed)
+
+    def choose_move(self, game_state):
+        """
+        Choose the move with the most visits over all workers' searches.
+
+        Args:
+            game_state: Current game state (a src.engine.GameEngine)
+
+        Returns:
+            tuple: (q, r) coordinates of the best move
+        """
+        valid_moves = game_state.legal_moves()
+        if not valid_moves:
+            return None
+        if game_state.ply() == 0:
+            return self._opening_move(valid_moves)
+
+        stats = self.root_statistics(game_state)
+        if not stats:
+            return random.choice(valid_moves)
+        return max(stats, key=lambda move: stats[move][0])
+
+    def root_statistics(self, game_state):
+        """
+        Search the position in every worker and merge the root statistics.
+
+        Args:
+            game_state: Current game state (left untouched)
+
+        Returns:
+            dict: {move: (visits, wins)} summed over all workers
+        """
+        pool = self._get_pool()
+        state = game_state.clone()
+        futures = [pool.submit(_search_root, state, self.iterations, self.time_limit_ms,
+                                    self.rng.getrandbits(32))
+                   for _ in range(self.workers)]
+
+        merged = {}
+        self.search_stats = {"iterations": 0, "elapsed_ms": 0.0, "workers": self.workers}
+        for future in futures:
+            stats, search_stats = future.result()
+            for move, (visits, wins) in stats.items():
+                total_visits, total_wins = merged.get(move, (0, 0))
+                merged[move] = (total_visits + visits, total_wins + wins)
+            self.search_stats["iterations"] += search_stats["iterations"]
+            self.search_stats["elapsed_ms"] = max(self.search_stats["elapsed_ms"],
+                                                  search_stats["elapsed_ms"])
+        return merged
+
+
+class TreeParallelMCTSAI(_PooledMCTSAI):
+    """
+    MCTS agent that grows one shared tree with rollouts in worker processes.
+
+    The main process selects and expands leaves, adding a virtual loss along
+    every path so that select_child steers later descents elsewhere, and
+    sends the leaves to the pool in batches. Each batch is backpropagated,
+    and its virtual loss removed, as soon as its worker returns.
+    """
+
+    def __init__(self, iterations=1000, name="Tree-Parallel MCTS AI", time_limit_ms=None,
+                 workers=None, leaves_per_task=4, seed=None):
+        """
+        Initialize the tree-parallel MCTS agent.
+
+        Args:
+            iterations (int): Total number of MCTS iterations
+            name (str): Name of the AI agent
+            time_limit_ms (float): If set, search until this many milliseconds
+                have passed instead of for a fixed number of iterations
+            workers (int): Number of worker processes (defaults to the CPU count)
+            leaves_per_task (int): Leaves sent to a worker in one batch
+            seed (int): Seed for the rollout seeds
+        """
+        super().__init__(iterations, name, time_limit_ms, workers, seed)
+        self.leaves_per_task = leaves_per_task
+
+    def _run(self, root, start):
+        pool = self._get_pool()
+        deadline = None if self.time_limit_ms is None else start + self.time_limit_ms / 1000
+        pending = {}
+        dispatched = 0
+
+        def budget_left():
+            if self.solver and root.proven is not None:
+                return False
+            if deadline is None:
+                return dispatched < self.iterations
+            return dispatched == 0 or time.perf_counter() < deadline
+
+        while True:
+            # Keep every worker busy with a batch of leaves
+            while len(pending) < self.workers and budget_left():
+                leaves = []
+                while len(leaves) < self.leaves_per_task and budget_left():
+                    path = self._select_and_expand(root)
+                    dispatched += 1
+                    if path[-1].is_terminal():
+                        # Nothing to play out, so score it straight away
+                        self._backpropagate(path, self._rollout(path[-1].game_state))
+                        continue
+                    self._add_virtual_loss(path, 1)
+                    leaves.append(path)
+                if leaves:
+                    future = pool.submit(_rollout_leaves, [path[-1].game_state for path in leaves],
+                                              self.rng.getrandbits(32), self.rollout_plies,
+                                              self.rollout_region, self.cutoff_scale)
+                    pending[future] = leaves
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                leaves = pending.pop(future)
+                for path, value in zip(leaves, future.result()):
+                    self._add_virtual_loss(path, -1)
+                    self._backpropagate(path, value)
+        return dispatched
+
+    def _add_virtual_loss(self, path, amount):
+        for node in path:
+            node.virtual_loss += amount